@@ -9,6 +9,7 @@ Python: 3.8+
 """
 
 import re
+import sys
 import json
 import time
 import argparse
@@ -19,6 +20,13 @@ import urllib.request
 import urllib.error
 from dataclasses import dataclass, asdict
 
+# Optional fast JSON serializer with native dataclass/datetime support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class ProductInfo:
@@ -179,6 +187,8 @@ class EbayExtractor(PriceExtractor):
 class PriceComparator:
     """Main class to handle price comparison logic"""
     
+    __slots__ = ('extractors', 'results')
+    
     def __init__(self):
         self.extractors = {
             'amazon.com': AmazonExtractor(),
@@ -245,14 +255,23 @@ class PriceComparator:
     def save_results(self, filename: str = "price_comparison.json") -> None:
         """Save results to JSON file"""
         try:
-            data = {
-                'timestamp': datetime.now().isoformat(),
-                'total_products': len(self.results),
-                'products': [asdict(product) for product in self.results]
-            }
-            
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                # orjson serializes the dataclasses and datetime directly
+                data = {
+                    'timestamp': datetime.now(),
+                    'total_products': len(self.results),
+                    'products': self.results
+                }
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                data = {
+                    'timestamp': datetime.now().isoformat(),
+                    'total_products': len(self.results),
+                    'products': [asdict(product) for product in self.results]
+                }
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=2)
             
             print(f"\nResults saved to {filename}")
         except Exception as e:
@@ -301,6 +320,7 @@ Examples:
   python main.py --urls "https://amazon.com/product1" "https://ebay.com/product1"
   python main.py --demo
   python main.py --interactive
+  python main.py --interactive --bulk < urls.txt
         """
     )
     
@@ -319,6 +339,11 @@ Examples:
         action='store_true', 
         help='Run in interactive mode'
     )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='With --interactive, read all URLs from one paste terminated by EOF'
+    )
     parser.add_argument(
         '--output', 
         default='price_comparison.json',
@@ -343,6 +368,18 @@ Examples:
             print("Running with demo data...")
             comparator.load_demo_data()
         
+        elif args.interactive and args.bulk:
+            print("Bulk mode - Paste URLs one per line, then press Ctrl-D (Ctrl-Z on Windows):")
+            raw = sys.stdin.read()
+            urls = [line.strip() for line in raw.splitlines()]
+            urls = [url for url in urls if url.startswith(('http://', 'https://'))]
+            print(f"Read {len(urls)} URLs")
+            
+            for i, url in enumerate(urls):
+                if i and args.delay > 0:
+                    time.sleep(args.delay)
+                comparator.add_url(url)
+        
         elif args.interactive:
             print("Interactive mode - Enter URLs one by one (empty line to finish):")
             while True:
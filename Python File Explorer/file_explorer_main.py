@@ -11,18 +11,100 @@ import shutil
 import stat
 import datetime
 import fnmatch
+import functools
+import atexit
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# GNU readline gives input() line editing and command history where available
+try:
+    import readline
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+HISTORY_FILE = Path.home() / '.file_explorer_history'
+
+
+_HELP_TEXT = """
+📚 PYTHON FILE EXPLORER - HELP
+================================
+
+NAVIGATION:
+  ls, list              - List directory contents
+  ls -a                 - List all files (including hidden)
+  cd <directory>        - Change directory
+  cd ..                 - Go to parent directory
+  pwd                   - Print current directory
+  back                  - Go back in history
+  forward               - Go forward in history
+
+FILE OPERATIONS:
+  touch <filename>      - Create empty file
+  mkdir <dirname>       - Create directory
+  rm <name>             - Delete file or directory
+  cp <source> <dest>    - Copy file or directory
+  mv <source> <dest>    - Move/rename file or directory
+
+SEARCH:
+  find <pattern>        - Search files in current directory
+  find -r <pattern>     - Search files recursively
+
+OTHER:
+  clear                 - Clear screen
+  help                  - Show this help
+  exit, quit            - Exit the program
+
+EXAMPLES:
+  cd Documents
+  touch newfile.txt
+  mkdir projects
+  find *.py
+  cp file1.txt backup.txt
+"""
+
+# st_mode -> permission string; stat.filemode is pure, so entries never go stale
+_FILEMODE_CACHE: Dict[int, str] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(cwd_str: str, path_str: str, absolute: bool) -> Path:
+    """Resolve a path argument relative to cwd, memoized per (cwd, argument)."""
+    if absolute:
+        return Path(path_str).resolve()
+    return (Path(cwd_str) / path_str).resolve()
 
 
 class FileExplorer:
     """A simple command-line file explorer with basic file operations."""
     
+    __slots__ = ('current_path', 'history', 'history_index', '_dispatch')
+    
     def __init__(self):
         self.current_path = Path.cwd()
         self.history = [self.current_path]
         self.history_index = 0
         
+        # Command name -> handler; a handler returning True ends the main loop
+        self._dispatch = {
+            'exit': self._cmd_exit,
+            'quit': self._cmd_exit,
+            'clear': self._cmd_clear,
+            'help': self._cmd_help,
+            'ls': self._cmd_ls,
+            'list': self._cmd_ls,
+            'pwd': self._cmd_pwd,
+            'cd': self._cmd_cd,
+            'back': self._cmd_back,
+            'forward': self._cmd_forward,
+            'touch': self._cmd_touch,
+            'mkdir': self._cmd_mkdir,
+            'rm': self._cmd_rm,
+            'cp': self._cmd_cp,
+            'mv': self._cmd_mv,
+            'find': self._cmd_find,
+        }
+        
     def clear_screen(self):
         """Clear the terminal screen."""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -64,7 +146,9 @@ class FileExplorer:
             
             # Permissions
             mode = stat_info.st_mode
-            permissions = stat.filemode(mode)
+            permissions = _FILEMODE_CACHE.get(mode)
+            if permissions is None:
+                permissions = _FILEMODE_CACHE.setdefault(mode, stat.filemode(mode))
             
             return file_type, size, mod_date, permissions
             
@@ -136,10 +220,9 @@ class FileExplorer:
                 new_path = self.current_path.parent
             elif path_str == ".":
                 return True
-            elif path_str.startswith("/") or (os.name == 'nt' and ":" in path_str):
-                new_path = Path(path_str).resolve()
             else:
-                new_path = (self.current_path / path_str).resolve()
+                absolute = path_str.startswith("/") or (os.name == 'nt' and ":" in path_str)
+                new_path = _resolve(str(self.current_path), path_str, absolute)
             
             if new_path.exists() and new_path.is_dir():
                 self.current_path = new_path
@@ -183,6 +266,7 @@ class FileExplorer:
                 return False
             
             dir_path.mkdir()
+            _resolve.cache_clear()
             print(f"Directory '{dirname}' created successfully.")
             return True
             
@@ -204,10 +288,11 @@ class FileExplorer:
             if response.lower() != 'y':
                 return False
             
-            if item_path.is_dir():
-                shutil.rmtree(item_path)
+            if item_path.is_dir() and not item_path.is_symlink():
+                self._remove_tree(item_path)
             else:
                 item_path.unlink()
+            _resolve.cache_clear()
             
             print(f"{item_type.capitalize()} '{name}' deleted successfully.")
             return True
@@ -216,6 +301,21 @@ class FileExplorer:
             print(f"Error deleting item: {e}")
             return False
     
+    def _remove_tree(self, path: Path) -> None:
+        """Remove a directory tree bottom-up, unlinking symlinks without following them."""
+        if os.name == 'nt':
+            shutil.rmtree(path)
+            return
+        
+        for root, _, _ in os.walk(path, topdown=False):
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        os.rmdir(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(root)
+    
     def copy_item(self, source: str, destination: str) -> bool:
         """Copy a file or directory."""
         try:
@@ -259,6 +359,7 @@ class FileExplorer:
                 dst_path = self.current_path / destination
             
             shutil.move(str(src_path), str(dst_path))
+            _resolve.cache_clear()
             print(f"'{source}' moved to '{destination}' successfully.")
             return True
             
@@ -303,46 +404,135 @@ class FileExplorer:
     
     def show_help(self):
         """Display help information."""
-        help_text = """
-📚 PYTHON FILE EXPLORER - HELP
-================================
-
-NAVIGATION:
-  ls, list              - List directory contents
-  ls -a                 - List all files (including hidden)
-  cd <directory>        - Change directory
-  cd ..                 - Go to parent directory
-  pwd                   - Print current directory
-  back                  - Go back in history
-  forward               - Go forward in history
-
-FILE OPERATIONS:
-  touch <filename>      - Create empty file
-  mkdir <dirname>       - Create directory
-  rm <name>             - Delete file or directory
-  cp <source> <dest>    - Copy file or directory
-  mv <source> <dest>    - Move/rename file or directory
-
-SEARCH:
-  find <pattern>        - Search files in current directory
-  find -r <pattern>     - Search files recursively
-
-OTHER:
-  clear                 - Clear screen
-  help                  - Show this help
-  exit, quit            - Exit the program
-
-EXAMPLES:
-  cd Documents
-  touch newfile.txt
-  mkdir projects
-  find *.py
-  cp file1.txt backup.txt
-        """
-        print(help_text)
+        sys.stdout.write(_HELP_TEXT)
+    
+    def _cmd_exit(self, args: List[str]) -> bool:
+        """Exit the program."""
+        print("Goodbye! 👋")
+        return True
+    
+    def _cmd_clear(self, args: List[str]) -> None:
+        """Handle the clear command."""
+        self.clear_screen()
+    
+    def _cmd_help(self, args: List[str]) -> None:
+        """Handle the help command."""
+        self.show_help()
+    
+    def _cmd_ls(self, args: List[str]) -> None:
+        """Handle the ls/list command."""
+        show_hidden = '-a' in args
+        self.display_directory(show_hidden)
+    
+    def _cmd_pwd(self, args: List[str]) -> None:
+        """Handle the pwd command."""
+        print(f"Current directory: {self.current_path}")
+    
+    def _cmd_cd(self, args: List[str]) -> None:
+        """Handle the cd command."""
+        if args:
+            self.change_directory(args[0])
+        else:
+            # Go to home directory
+            self.change_directory(str(Path.home()))
+    
+    def _cmd_back(self, args: List[str]) -> None:
+        """Handle the back command."""
+        self.navigate_history('back')
+    
+    def _cmd_forward(self, args: List[str]) -> None:
+        """Handle the forward command."""
+        self.navigate_history('forward')
+    
+    def _cmd_touch(self, args: List[str]) -> None:
+        """Handle the touch command."""
+        if args:
+            self.create_file(args[0])
+        else:
+            print("Usage: touch <filename>")
+    
+    def _cmd_mkdir(self, args: List[str]) -> None:
+        """Handle the mkdir command."""
+        if args:
+            self.create_directory(args[0])
+        else:
+            print("Usage: mkdir <directory_name>")
+    
+    def _cmd_rm(self, args: List[str]) -> None:
+        """Handle the rm command."""
+        if args:
+            self.delete_item(args[0])
+        else:
+            print("Usage: rm <file_or_directory>")
+    
+    def _cmd_cp(self, args: List[str]) -> None:
+        """Handle the cp command."""
+        if len(args) >= 2:
+            self.copy_item(args[0], args[1])
+        else:
+            print("Usage: cp <source> <destination>")
+    
+    def _cmd_mv(self, args: List[str]) -> None:
+        """Handle the mv command."""
+        if len(args) >= 2:
+            self.move_item(args[0], args[1])
+        else:
+            print("Usage: mv <source> <destination>")
+    
+    def _cmd_find(self, args: List[str]) -> None:
+        """Handle the find command."""
+        if not args:
+            print("Usage: find <pattern> or find -r <pattern>")
+            return
+        
+        recursive = args[0] == '-r'
+        pattern = args[1] if recursive and len(args) > 1 else args[0]
+        
+        if recursive and len(args) < 2:
+            print("Usage: find -r <pattern>")
+            return
+        
+        matches = self.search_files(pattern, recursive)
+        if matches:
+            print(f"\nFound {len(matches)} matches:")
+            for match in matches:
+                rel_path = match.relative_to(self.current_path) if recursive else match.name
+                file_type = "📁" if match.is_dir() else "📄"
+                print(f"  {file_type} {rel_path}")
+        else:
+            print(f"No files found matching '{pattern}'")
+    
+    def _setup_readline(self) -> None:
+        """Enable persistent command history and command-name tab completion."""
+        if not READLINE_AVAILABLE:
+            return
+        
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+        readline.set_history_length(1000)
+        
+        def save_history() -> None:
+            try:
+                readline.write_history_file(HISTORY_FILE)
+            except OSError:
+                pass
+        
+        atexit.register(save_history)
+        
+        commands = sorted(self._dispatch)
+        
+        def complete(text: str, state: int) -> Optional[str]:
+            matches = [c for c in commands if c.startswith(text)]
+            return matches[state] if state < len(matches) else None
+        
+        readline.set_completer(complete)
+        readline.parse_and_bind("tab: complete")
     
     def run(self):
         """Main program loop."""
+        self._setup_readline()
         print("🗂️  Python File Explorer")
         print("Type 'help' for commands or 'exit' to quit.")
         
@@ -356,94 +546,15 @@ EXAMPLES:
                     continue
                 
                 # Parse command
-                parts = command.split()
-                cmd = parts[0].lower()
-                args = parts[1:] if len(parts) > 1 else []
-                
-                # Execute commands
-                if cmd in ['exit', 'quit']:
-                    print("Goodbye! 👋")
-                    break
-                
-                elif cmd == 'clear':
-                    self.clear_screen()
-                
-                elif cmd == 'help':
-                    self.show_help()
-                
-                elif cmd in ['ls', 'list']:
-                    show_hidden = '-a' in args
-                    self.display_directory(show_hidden)
-                
-                elif cmd == 'pwd':
-                    print(f"Current directory: {self.current_path}")
+                cmd, *args = command.split()
+                cmd = cmd.lower()
                 
-                elif cmd == 'cd':
-                    if args:
-                        self.change_directory(args[0])
-                    else:
-                        # Go to home directory
-                        self.change_directory(str(Path.home()))
-                
-                elif cmd == 'back':
-                    self.navigate_history('back')
-                
-                elif cmd == 'forward':
-                    self.navigate_history('forward')
-                
-                elif cmd == 'touch':
-                    if args:
-                        self.create_file(args[0])
-                    else:
-                        print("Usage: touch <filename>")
-                
-                elif cmd == 'mkdir':
-                    if args:
-                        self.create_directory(args[0])
-                    else:
-                        print("Usage: mkdir <directory_name>")
-                
-                elif cmd == 'rm':
-                    if args:
-                        self.delete_item(args[0])
-                    else:
-                        print("Usage: rm <file_or_directory>")
-                
-                elif cmd == 'cp':
-                    if len(args) >= 2:
-                        self.copy_item(args[0], args[1])
-                    else:
-                        print("Usage: cp <source> <destination>")
-                
-                elif cmd == 'mv':
-                    if len(args) >= 2:
-                        self.move_item(args[0], args[1])
-                    else:
-                        print("Usage: mv <source> <destination>")
-                
-                elif cmd == 'find':
-                    if args:
-                        recursive = args[0] == '-r'
-                        pattern = args[1] if recursive and len(args) > 1 else args[0]
-                        
-                        if recursive and len(args) < 2:
-                            print("Usage: find -r <pattern>")
-                            continue
-                        
-                        matches = self.search_files(pattern, recursive)
-                        if matches:
-                            print(f"\nFound {len(matches)} matches:")
-                            for match in matches:
-                                rel_path = match.relative_to(self.current_path) if recursive else match.name
-                                file_type = "📁" if match.is_dir() else "📄"
-                                print(f"  {file_type} {rel_path}")
-                        else:
-                            print(f"No files found matching '{pattern}'")
-                    else:
-                        print("Usage: find <pattern> or find -r <pattern>")
-                
-                else:
+                # Execute command
+                handler = self._dispatch.get(cmd)
+                if handler is None:
                     print(f"Unknown command: {cmd}. Type 'help' for available commands.")
+                elif handler(args):
+                    break
             
             except KeyboardInterrupt:
                 print("\n\nUse 'exit' to quit the program.")
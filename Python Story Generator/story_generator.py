@@ -6,9 +6,38 @@ Compatible with Python 3.10+
 """
 
 import random
-import re
+import string
+import textwrap
+import time
 from typing import Dict, List, Tuple
-from datetime import datetime
+
+
+# Letters, whitespace, apostrophes and hyphens
+_ALLOWED_WORD_CHARS = frozenset(string.ascii_letters + string.whitespace + "'-")
+
+# Fallback suggestions for a category with no word list
+DEFAULT_SUGGESTIONS = ("something",)
+
+# Story words in collection order; a None prompt means the word is picked at random
+WORD_PROMPTS = (
+    ("character_name", "Enter the main character's name"),
+    ("profession", "Enter a profession/job"),
+    ("location", "Enter a place/location"),
+    ("adjective_1", "Enter a descriptive word (adjective)"),
+    ("adjective_2", "Enter another descriptive word"),
+    ("adjective_3", "Enter a third descriptive word"),
+    ("adjective_4", "Enter a fourth descriptive word"),
+    ("final_adjective", "Enter a final descriptive word"),
+    ("object", "Enter an object/item"),
+    ("creature", "Enter a creature/animal"),
+    ("destination", "Enter a destination/place"),
+    ("treasure", "Enter something valuable"),
+    ("magical_power", "Enter a special ability"),
+    ("action_verb", "Enter an action word"),
+    ("victory_action", "Enter a victory action"),
+    ("helped_or_hindered", None),
+    ("hiding_place", None),
+)
 
 
 class StoryGenerator:
@@ -80,6 +109,21 @@ class StoryGenerator:
             "helped_or_hindered": ["helped", "guided", "challenged", "tested", "befriended"],
             "hiding_place": ["attic", "basement", "garden", "closet", "trunk"]
         }
+        self.word_suggestions = {k: tuple(v) for k, v in self.word_suggestions.items()}
+        
+        # Dedicated RNG with a bound choice method for random word picks
+        self._rng = random.Random()
+        self._choice = self._rng.choice
+        
+        # Parse each template once into (literal, field) parts for fast rendering
+        formatter = string.Formatter()
+        self._compiled_templates = {
+            genre: [
+                [(literal, field) for literal, field, _, _ in formatter.parse(template)]
+                for template in templates
+            ]
+            for genre, templates in self.story_templates.items()
+        }
 
     def display_welcome(self) -> None:
         """Display welcome message and instructions."""
@@ -111,7 +155,7 @@ class StoryGenerator:
 
     def get_user_input(self, prompt: str, category: str) -> str:
         """Get user input with suggestions and validation."""
-        suggestions = self.word_suggestions.get(category, [])
+        suggestions = self.word_suggestions.get(category, ())
         
         if suggestions:
             suggestion_text = f" (suggestions: {', '.join(suggestions[:3])}...)"
@@ -123,7 +167,7 @@ class StoryGenerator:
             
             if not user_input:  # Use random suggestion
                 if suggestions:
-                    user_input = random.choice(suggestions)
+                    user_input = self._choice(suggestions)
                     print(f"✨ Using: {user_input}")
                 else:
                     user_input = "mysterious thing"
@@ -141,7 +185,7 @@ class StoryGenerator:
             return False
         
         # Allow letters, spaces, and basic punctuation
-        if not re.match(r"^[a-zA-Z\s'-]+$", text):
+        if not _ALLOWED_WORD_CHARS.issuperset(text):
             return False
             
         return True
@@ -154,48 +198,34 @@ class StoryGenerator:
         print("(Press Enter for random suggestions)")
         print("-" * 40)
         
-        # Define the order and prompts for word collection
-        word_prompts = [
-            ("character_name", "Enter the main character's name"),
-            ("profession", "Enter a profession/job"),
-            ("location", "Enter a place/location"),
-            ("adjective_1", "Enter a descriptive word (adjective)"),
-            ("adjective_2", "Enter another descriptive word"),
-            ("adjective_3", "Enter a third descriptive word"),
-            ("adjective_4", "Enter a fourth descriptive word"),
-            ("final_adjective", "Enter a final descriptive word"),
-            ("object", "Enter an object/item"),
-            ("creature", "Enter a creature/animal"),
-            ("destination", "Enter a destination/place"),
-            ("treasure", "Enter something valuable"),
-            ("magical_power", "Enter a special ability"),
-            ("action_verb", "Enter an action word"),
-            ("victory_action", "Enter a victory action"),
-        ]
-        
-        for key, prompt in word_prompts:
-            words[key] = self.get_user_input(prompt, key)
-        
-        # Add some additional words that might be needed
-        additional_words = ["helped_or_hindered", "hiding_place"]
-        for key in additional_words:
-            if key not in words:
-                words[key] = random.choice(self.word_suggestions.get(key, ["something"]))
+        # One pass over all story words: prompt for some, pick the rest at random
+        for key, prompt in WORD_PROMPTS:
+            if prompt is None:
+                words[key] = self._choice(self.word_suggestions.get(key) or DEFAULT_SUGGESTIONS)
+            else:
+                words[key] = self.get_user_input(prompt, key)
         
         return words
 
+    def _render(self, parts: List[Tuple[str, str]], words: Dict[str, str]) -> str:
+        """Render a pre-parsed template with the given words."""
+        return "".join(
+            literal + (str(words[field]) if field is not None else "")
+            for literal, field in parts
+        )
+
     def generate_story(self, genre: str, words: Dict[str, str]) -> str:
         """Generate a story using the template and user words."""
-        template = random.choice(self.story_templates[genre])
+        parts = random.choice(self._compiled_templates[genre])
         
         try:
-            story = template.format(**words)
+            story = self._render(parts, words)
             return story
         except KeyError as e:
             # Handle missing keys gracefully
             print(f"Warning: Missing word for {e}, using default...")
             words[str(e).strip("'")] = "mysterious thing"
-            story = template.format(**words)
+            story = self._render(parts, words)
             return story
 
     def display_story(self, story: str, genre: str) -> None:
@@ -206,21 +236,7 @@ class StoryGenerator:
         print()
         
         # Word wrap for better readability
-        words = story.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            current_line.append(word)
-            if len(' '.join(current_line)) > 70:
-                lines.append(' '.join(current_line))
-                current_line = []
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        for line in lines:
-            print(line)
+        print(textwrap.fill(story, width=70))
         
         print("\n" + "=" * 80)
 
@@ -229,7 +245,8 @@ class StoryGenerator:
         save = input("\n💾 Would you like to save your story to a file? (y/n): ").lower().strip()
         
         if save.startswith('y'):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = time.localtime()
+            timestamp = time.strftime("%Y%m%d_%H%M%S", now)
             filename = f"story_{genre}_{timestamp}.txt"
             
             try:
@@ -237,7 +254,7 @@ class StoryGenerator:
                     f.write(f"Generated Story - {genre.title()}\n")
                     f.write("=" * 40 + "\n\n")
                     f.write(story)
-                    f.write(f"\n\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                    f.write(f"\n\nGenerated on: {time.strftime('%Y-%m-%d %H:%M:%S', now)}")
                 
                 print(f"✅ Story saved as: {filename}")
             except Exception as e:
@@ -12,13 +12,24 @@ Python Version: 3.7+
 
 import os
 import sys
+import shutil
 import time
 import argparse
 import platform
-import datetime
-from pathlib import Path
-from typing import List, Optional, Set
 import re
+import string
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+
+# Buffer size for hosts/backup file I/O
+_IO_BUFFER_SIZE = 128 * 1024
+
+# Optional scheme and www. prefix, then the host up to the first path separator
+_NORMALIZE_RE = re.compile(r'^(?:https?://)?(?:www\.)?([^/\s]+)', re.IGNORECASE)
+
+# Characters allowed anywhere in a domain name
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '-.')
 
 
 class WebsiteBlocker:
@@ -32,6 +43,13 @@ class WebsiteBlocker:
         self.redirect_ip = "127.0.0.1"
         self.block_marker_start = "# === WEBSITE BLOCKER START ==="
         self.block_marker_end = "# === WEBSITE BLOCKER END ==="
+        # Captures the domain of every "<redirect_ip> <domain>" entry line
+        self._entry_re = re.compile(rf'^{re.escape(self.redirect_ip)}[ \t]+(\S+)', re.MULTILINE)
+        # (st_mtime_ns, parsed value) caches of the hosts file
+        self._hosts_cache: Optional[Tuple[int, str]] = None
+        self._blocked_cache: Optional[Tuple[int, Set[str]]] = None
+        # Privileges cannot change mid-process, so check them once
+        self._is_admin = self._check_admin_privileges()
     
     def _get_hosts_file_path(self) -> Path:
         """Get the system-specific hosts file path."""
@@ -53,39 +71,67 @@ class WebsiteBlocker:
     
     def _validate_domain(self, domain: str) -> bool:
         """Validate if a domain name is properly formatted."""
-        # Basic domain validation regex
-        pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
-        return bool(re.match(pattern, domain)) and len(domain) <= 253
+        if not domain or len(domain) > 253:
+            return False
+        if domain[0] in '-.' or domain[-1] in '-.' or '..' in domain:
+            return False
+        if not _DOMAIN_CHARS.issuperset(domain):
+            return False
+        
+        # Labels are now non-empty and alphanumeric/hyphen only; each must be
+        # at most 63 characters and must not start or end with a hyphen
+        for label in domain.split('.'):
+            if len(label) > 63 or label[0] == '-' or label[-1] == '-':
+                return False
+        return True
     
     def _normalize_domain(self, domain: str) -> str:
         """Normalize domain by removing protocol and trailing slashes."""
-        # Remove common prefixes
-        domain = domain.replace("http://", "").replace("https://", "")
-        domain = domain.replace("www.", "")
-        # Remove trailing slash and path components
-        domain = domain.split('/')[0].strip().lower()
-        return domain
+        domain = domain.strip()
+        match = _NORMALIZE_RE.match(domain)
+        return match.group(1).lower() if match else domain.lower()
     
-    def _read_hosts_file(self) -> List[str]:
+    def _read_hosts_file(self) -> str:
         """Read the contents of the hosts file."""
         try:
-            with open(self.hosts_file, 'r', encoding='utf-8') as f:
-                return f.readlines()
+            mtime = os.stat(self.hosts_file).st_mtime_ns
+            if self._hosts_cache is not None and self._hosts_cache[0] == mtime:
+                return self._hosts_cache[1]
+            
+            with open(self.hosts_file, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                content = f.read()
+            self._hosts_cache = (mtime, content)
+            return content
         except FileNotFoundError:
             print(f"Error: Hosts file not found at {self.hosts_file}")
-            return []
+            return ""
         except PermissionError:
             print("Error: Permission denied. Please run as administrator/root.")
-            return []
+            return ""
         except Exception as e:
             print(f"Error reading hosts file: {e}")
-            return []
+            return ""
     
-    def _write_hosts_file(self, lines: List[str]) -> bool:
+    def _write_hosts_file(self, content: str) -> bool:
         """Write content to the hosts file."""
         try:
-            with open(self.hosts_file, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
+            self._hosts_cache = None
+            self._blocked_cache = None
+            
+            # Write a sibling temp file and swap it in so a crash never leaves
+            # a half-written hosts file behind
+            target = self.hosts_file.resolve()
+            tmp_file = target.with_name(target.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(content)
+            try:
+                shutil.copymode(target, tmp_file)
+                os.replace(tmp_file, target)
+            except OSError:
+                # e.g. a bind-mounted hosts file cannot be replaced; write in place
+                os.unlink(tmp_file)
+                with open(target, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                    f.write(content)
             return True
         except PermissionError:
             print("Error: Permission denied. Please run as administrator/root.")
@@ -97,43 +143,64 @@ class WebsiteBlocker:
     def _create_backup(self) -> bool:
         """Create a backup of the current hosts file."""
         try:
-            lines = self._read_hosts_file()
-            if not lines:
-                return False
-            
-            with open(self.backup_file, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
+            # Kernel-side copy (sendfile/fcopyfile) where available, no decode/encode
+            shutil.copyfile(self.hosts_file, self.backup_file)
             return True
         except Exception as e:
             print(f"Error creating backup: {e}")
             return False
     
+    def _split_block_section(self, content: str) -> Tuple[str, str, str]:
+        """Split hosts content into the text before, inside and after the block section.
+        
+        The marker lines themselves are not part of any of the returned pieces.
+        """
+        before, found, rest = content.partition(self.block_marker_start)
+        if not found:
+            return content, "", ""
+        
+        block, found, after = rest.partition(self.block_marker_end)
+        if found and after.startswith("\n"):
+            after = after[1:]
+        return before, block, after
+    
+    def _remove_block_section(self, content: str) -> str:
+        """Return the hosts content with the block section cut out."""
+        before, _, after = self._split_block_section(content)
+        # Drop the blank separator line that block_websites puts before the section
+        if before.endswith("\n\n"):
+            before = before[:-1]
+        return before + after
+    
+    def _entry_domain(self, line: str) -> Optional[str]:
+        """Return the domain (without www.) of a redirect entry line, or None."""
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].startswith(self.redirect_ip):
+            domain = parts[1]
+            return domain[4:] if domain.startswith('www.') else domain
+        return None
+    
     def _get_blocked_websites(self) -> Set[str]:
         """Get currently blocked websites from the hosts file."""
-        lines = self._read_hosts_file()
-        blocked_sites = set()
-        in_block_section = False
+        content = self._read_hosts_file()
+        if (self._hosts_cache is not None and self._blocked_cache is not None
+                and self._blocked_cache[0] == self._hosts_cache[0]):
+            return self._blocked_cache[1]
         
-        for line in lines:
-            line = line.strip()
-            if line == self.block_marker_start:
-                in_block_section = True
-                continue
-            elif line == self.block_marker_end:
-                in_block_section = False
-                continue
-            elif in_block_section and line.startswith(self.redirect_ip):
-                # Extract domain from the line
-                parts = line.split()
-                if len(parts) >= 2:
-                    domain = parts[1]
-                    blocked_sites.add(domain)
+        _, block, _ = self._split_block_section(content)
+        # www. entries mirror the bare domain; store each site once
+        blocked_sites = {
+            domain[4:] if domain.startswith('www.') else domain
+            for domain in self._entry_re.findall(block)
+        }
         
+        if self._hosts_cache is not None:
+            self._blocked_cache = (self._hosts_cache[0], blocked_sites)
         return blocked_sites
     
     def block_websites(self, domains: List[str]) -> bool:
         """Block the specified websites."""
-        if not self._check_admin_privileges():
+        if not self._is_admin:
             print("Error: This operation requires administrator/root privileges.")
             print("Please run the script as administrator (Windows) or with sudo (Linux/macOS).")
             return False
@@ -155,35 +222,25 @@ class WebsiteBlocker:
         if not self._create_backup():
             print("Warning: Could not create backup file.")
         
-        lines = self._read_hosts_file()
-        if not lines:
+        content = self._read_hosts_file()
+        if not content:
             return False
         
         # Remove existing block section if it exists
-        filtered_lines = []
-        in_block_section = False
-        
-        for line in lines:
-            if line.strip() == self.block_marker_start:
-                in_block_section = True
-                continue
-            elif line.strip() == self.block_marker_end:
-                in_block_section = False
-                continue
-            elif not in_block_section:
-                filtered_lines.append(line)
+        content = self._remove_block_section(content)
+        if not content.endswith("\n"):
+            content += "\n"
         
         # Add new block section
-        filtered_lines.append(f"\n{self.block_marker_start}\n")
-        filtered_lines.append(f"# Website Blocker - Added on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        
-        for domain in valid_domains:
-            filtered_lines.append(f"{self.redirect_ip} {domain}\n")
-            filtered_lines.append(f"{self.redirect_ip} www.{domain}\n")
+        ip = self.redirect_ip
+        entries = "".join(f"{ip} {domain}\n{ip} www.{domain}\n" for domain in valid_domains)
+        content = (
+            f"{content}\n{self.block_marker_start}\n"
+            f"# Website Blocker - Added on {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{entries}{self.block_marker_end}\n"
+        )
         
-        filtered_lines.append(f"{self.block_marker_end}\n")
-        
-        if self._write_hosts_file(filtered_lines):
+        if self._write_hosts_file(content):
             print(f"Successfully blocked {len(valid_domains)} website(s):")
             for domain in valid_domains:
                 print(f"  - {domain}")
@@ -193,12 +250,12 @@ class WebsiteBlocker:
     
     def unblock_websites(self, domains: Optional[List[str]] = None) -> bool:
         """Unblock specified websites or all blocked websites."""
-        if not self._check_admin_privileges():
+        if not self._is_admin:
             print("Error: This operation requires administrator/root privileges.")
             return False
         
-        lines = self._read_hosts_file()
-        if not lines:
+        content = self._read_hosts_file()
+        if not content:
             return False
         
         # Create backup before making changes
@@ -207,50 +264,25 @@ class WebsiteBlocker:
         
         if domains is None:
             # Remove entire block section
-            filtered_lines = []
-            in_block_section = False
-            
-            for line in lines:
-                if line.strip() == self.block_marker_start:
-                    in_block_section = True
-                    continue
-                elif line.strip() == self.block_marker_end:
-                    in_block_section = False
-                    continue
-                elif not in_block_section:
-                    filtered_lines.append(line)
-            
-            if self._write_hosts_file(filtered_lines):
+            if self._write_hosts_file(self._remove_block_section(content)):
                 print("Successfully unblocked all websites.")
                 return True
         else:
             # Remove specific domains
-            domains_to_remove = [self._normalize_domain(d) for d in domains]
-            filtered_lines = []
-            in_block_section = False
-            removed_count = 0
+            domains_to_remove = {self._normalize_domain(d) for d in domains}
+            before, block, after = self._split_block_section(content)
+            block_lines = block.splitlines(keepends=True)
+            kept_lines = [
+                line for line in block_lines
+                if self._entry_domain(line) not in domains_to_remove
+            ]
+            removed_count = len(block_lines) - len(kept_lines)
             
-            for line in lines:
-                if line.strip() == self.block_marker_start:
-                    in_block_section = True
-                    filtered_lines.append(line)
-                    continue
-                elif line.strip() == self.block_marker_end:
-                    in_block_section = False
-                    filtered_lines.append(line)
-                    continue
-                elif in_block_section and line.strip().startswith(self.redirect_ip):
-                    # Check if this line contains a domain to remove
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        domain = parts[1].replace("www.", "")
-                        if domain in domains_to_remove:
-                            removed_count += 1
-                            continue
-                
-                filtered_lines.append(line)
+            if block:
+                content = (before + self.block_marker_start + "".join(kept_lines)
+                           + self.block_marker_end + "\n" + after)
             
-            if self._write_hosts_file(filtered_lines):
+            if self._write_hosts_file(content):
                 print(f"Successfully unblocked {removed_count // 2} website(s).")
                 return True
         
@@ -264,14 +296,13 @@ class WebsiteBlocker:
             print("No websites are currently blocked.")
             return
         
-        print(f"Currently blocked websites ({len(blocked_sites)}):")
-        for site in sorted(blocked_sites):
-            if not site.startswith("www."):
-                print(f"  - {site}")
+        lines = [f"Currently blocked websites ({len(blocked_sites)}):"]
+        lines.extend(f"  - {site}" for site in sorted(blocked_sites))
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def restore_backup(self) -> bool:
         """Restore the hosts file from backup."""
-        if not self._check_admin_privileges():
+        if not self._is_admin:
             print("Error: This operation requires administrator/root privileges.")
             return False
         
@@ -280,10 +311,10 @@ class WebsiteBlocker:
             return False
         
         try:
-            with open(self.backup_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            with open(self.backup_file, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                content = f.read()
             
-            if self._write_hosts_file(lines):
+            if self._write_hosts_file(content):
                 print("Successfully restored hosts file from backup.")
                 return True
         except Exception as e:
@@ -4,21 +4,36 @@ Interactive Quiz Application
 A command-line quiz app with multiple categories, scoring, and progress tracking.
 """
 
+import atexit
 import json
+import heapq
 import random
 import os
+import sqlite3
+import sys
+from array import array
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
 
+SCORES_DB_FILE = 'quiz_scores.db'
+LEGACY_SCORES_FILE = 'quiz_scores.json'
+MAX_HIGH_SCORES = 5  # Scores kept per category
+SCORE_FLUSH_INTERVAL = 5  # Commit pending scores after this many changes
+
+
 class QuizQuestion:
     """Represents a single quiz question with multiple choice answers."""
     
+    __slots__ = ('question', 'options', 'correct_answer', 'explanation', '_correct_text')
+    
     def __init__(self, question: str, options: List[str], correct_answer: int, explanation: str = ""):
-        self.question = question
-        self.options = options
+        # Interned so answer records and repeated option texts share one copy
+        self.question = sys.intern(question)
+        self.options = [sys.intern(option) for option in options]
         self.correct_answer = correct_answer  # Index of correct option (0-based)
-        self.explanation = explanation
+        self.explanation = sys.intern(explanation)
+        self._correct_text = self.options[correct_answer]
     
     def is_correct(self, answer_index: int) -> bool:
         """Check if the given answer index is correct."""
@@ -26,30 +41,43 @@ class QuizQuestion:
     
     def get_correct_answer_text(self) -> str:
         """Get the text of the correct answer."""
-        return self.options[self.correct_answer]
+        return self._correct_text
 
 
 class QuizCategory:
     """Represents a category of quiz questions."""
     
+    __slots__ = ('name', 'questions', 'correct_answers')
+    
     def __init__(self, name: str, questions: List[QuizQuestion]):
         self.name = name
         self.questions = questions
+        # Correct option index per question, stored contiguously for scoring
+        self.correct_answers = array('B', (q.correct_answer for q in questions))
+    
+    def get_random_indices(self, count: int) -> List[int]:
+        """Get the indices of a random sample of questions from this category."""
+        return random.sample(range(len(self.questions)), min(count, len(self.questions)))
     
     def get_random_questions(self, count: int) -> List[QuizQuestion]:
         """Get a random sample of questions from this category."""
-        return random.sample(self.questions, min(count, len(self.questions)))
+        return [self.questions[i] for i in self.get_random_indices(count)]
 
 
 class QuizSession:
     """Manages a single quiz session with scoring and progress tracking."""
     
+    __slots__ = ('category', 'question_indices', 'questions', 'current_question',
+                 'score', 'answers', 'feedback_log', 'start_time')
+    
     def __init__(self, category: QuizCategory, num_questions: int):
         self.category = category
-        self.questions = category.get_random_questions(num_questions)
+        self.question_indices = category.get_random_indices(num_questions)
+        self.questions = [category.questions[i] for i in self.question_indices]
         self.current_question = 0
         self.score = 0
         self.answers = []  # Store user answers for review
+        self.feedback_log: List[str] = []  # Buffered feedback in non-interactive mode
         self.start_time = datetime.now()
     
     def get_current_question(self) -> Optional[QuizQuestion]:
@@ -64,7 +92,8 @@ class QuizSession:
         if question is None:
             return False
         
-        is_correct = question.is_correct(answer_index)
+        correct_index = self.category.correct_answers[self.question_indices[self.current_question]]
+        is_correct = answer_index == correct_index
         if is_correct:
             self.score += 1
         
@@ -105,9 +134,26 @@ class QuizSession:
 class QuizApp:
     """Main application class that manages the quiz experience."""
     
-    def __init__(self):
+    def __init__(self, interactive: bool = True):
+        # When False, answer feedback is buffered and shown with the final results
+        # instead of pausing for Enter after every question
+        self.interactive = interactive
         self.categories = self._load_quiz_data()
-        self.high_scores = self._load_high_scores()
+        self._category_names = tuple(self.categories)
+        self._num_categories = len(self._category_names)
+        self._category_menu_lines = tuple(
+            f"{i}. {name} ({len(category.questions)} questions)"
+            for i, (name, category) in enumerate(self.categories.items(), 1)
+        )
+        # The score database (and any legacy import) is opened on first use,
+        # so starting a quiz does not pay for it
+        self._db_conn: Optional[sqlite3.Connection] = None
+        # category -> min-heap of (percentage, -rowid) for its current top scores
+        self._top_scores: Dict[str, List[Tuple[float, int]]] = {}
+        # Score changes are batched in one transaction and committed by _flush_scores
+        self._dirty = False
+        self._pending_changes = 0
+        atexit.register(self._flush_scores)
     
     def _load_quiz_data(self) -> Dict[str, QuizCategory]:
         """Load quiz questions and categories."""
@@ -217,44 +263,141 @@ class QuizApp:
         
         return categories
     
-    def _load_high_scores(self) -> Dict[str, List[Dict]]:
-        """Load high scores from file if it exists."""
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """Get the high score database, opening it on first access."""
+        if self._db_conn is None:
+            self._db_conn = self._open_scores_db()
+        return self._db_conn
+    
+    def _open_scores_db(self) -> sqlite3.Connection:
+        """Open the high score database, creating the schema if needed."""
         try:
-            if os.path.exists('quiz_scores.json'):
-                with open('quiz_scores.json', 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not load high scores: {e}")
+            db = sqlite3.connect(SCORES_DB_FILE, isolation_level=None)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open high scores database: {e}")
+            db = sqlite3.connect(':memory:', isolation_level=None)
         
-        return {category: [] for category in self.categories.keys()}
+        # Commits append to a write-ahead log instead of rewriting database
+        # pages, and only checkpoints need an fsync
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS high_scores ("
+            "category TEXT NOT NULL, score INTEGER NOT NULL, total INTEGER NOT NULL, "
+            "percentage REAL NOT NULL, duration TEXT NOT NULL, date TEXT NOT NULL)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cat_pct ON high_scores(category, percentage DESC)"
+        )
+        self._import_legacy_scores(db)
+        return db
+    
+    def _import_legacy_scores(self, db: sqlite3.Connection):
+        """Import scores from the old JSON file into an empty database."""
+        if not os.path.exists(LEGACY_SCORES_FILE):
+            return
+        if db.execute("SELECT 1 FROM high_scores LIMIT 1").fetchone():
+            return
+        
+        try:
+            with open(LEGACY_SCORES_FILE, 'r') as f:
+                legacy_scores = json.load(f)
+            rows = [
+                (category, entry['score'], entry['total'], entry['percentage'],
+                 entry['duration'], entry['date'])
+                for category, entries in legacy_scores.items()
+                for entry in entries
+            ]
+            db.executemany("INSERT INTO high_scores VALUES (?, ?, ?, ?, ?, ?)", rows)
+        except (json.JSONDecodeError, IOError, KeyError, AttributeError, sqlite3.Error) as e:
+            print(f"Warning: Could not import high scores from {LEGACY_SCORES_FILE}: {e}")
     
-    def _save_high_scores(self):
-        """Save high scores to file."""
+    def _get_high_scores(self) -> Dict[str, List[Dict]]:
+        """Get the top scores per category, best first."""
+        high_scores = {category: [] for category in self.categories}
+        
         try:
-            with open('quiz_scores.json', 'w') as f:
-                json.dump(self.high_scores, f, indent=2)
-        except IOError as e:
-            print(f"Warning: Could not save high scores: {e}")
+            rows = self._db.execute(
+                "SELECT category, score, total, percentage, duration, date FROM high_scores "
+                "ORDER BY category, percentage DESC, rowid"
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not load high scores: {e}")
+            return high_scores
+        
+        for category, score, total, percentage, duration, date in rows:
+            scores = high_scores.setdefault(category, [])
+            if len(scores) >= MAX_HIGH_SCORES:
+                continue
+            scores.append({
+                'score': score,
+                'total': total,
+                'percentage': percentage,
+                'duration': duration,
+                'date': date
+            })
+        
+        return high_scores
+    
+    def _get_top_scores(self, category: str) -> List[Tuple[float, int]]:
+        """Get the top-score heap for a category, loading it on first use."""
+        heap = self._top_scores.get(category)
+        if heap is None:
+            rows = self._db.execute(
+                "SELECT percentage, rowid FROM high_scores WHERE category = ? "
+                "ORDER BY percentage DESC, rowid LIMIT ?",
+                (category, MAX_HIGH_SCORES)
+            ).fetchall()
+            # The root is the lowest score; among equal scores, the newest one
+            heap = [(percentage, -rowid) for percentage, rowid in rows]
+            heapq.heapify(heap)
+            self._top_scores[category] = heap
+        return heap
     
     def _add_high_score(self, category: str, score: int, total: int, duration: str):
         """Add a new high score."""
-        if category not in self.high_scores:
-            self.high_scores[category] = []
-        
-        score_entry = {
-            'score': score,
-            'total': total,
-            'percentage': (score / total) * 100,
-            'duration': duration,
-            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        percentage = (score / total) * 100
         
-        self.high_scores[category].append(score_entry)
-        # Keep only top 5 scores per category
-        self.high_scores[category].sort(key=lambda x: x['percentage'], reverse=True)
-        self.high_scores[category] = self.high_scores[category][:5]
+        try:
+            heap = self._get_top_scores(category)
+            # A score that does not beat the current lowest top score is not kept
+            if len(heap) >= MAX_HIGH_SCORES and percentage <= heap[0][0]:
+                return
+            
+            if not self._db.in_transaction:
+                self._db.execute("BEGIN")
+            cursor = self._db.execute(
+                "INSERT INTO high_scores VALUES (?, ?, ?, ?, ?, ?)",
+                (category, score, total, percentage, duration,
+                 datetime.now().isoformat(sep=' ', timespec='seconds'))
+            )
+            entry = (percentage, -cursor.lastrowid)
+            
+            if len(heap) < MAX_HIGH_SCORES:
+                heapq.heappush(heap, entry)
+            else:
+                _, evicted = heapq.heappushpop(heap, entry)
+                self._db.execute("DELETE FROM high_scores WHERE rowid = ?", (-evicted,))
+            
+            self._dirty = True
+            self._pending_changes += 1
+            if self._pending_changes >= SCORE_FLUSH_INTERVAL:
+                self._flush_scores()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not save high scores: {e}")
+    
+    def _flush_scores(self):
+        """Commit pending high score changes to disk."""
+        if not self._dirty:
+            return
         
-        self._save_high_scores()
+        try:
+            self._db.commit()
+            self._dirty = False
+            self._pending_changes = 0
+        except sqlite3.Error as e:
+            print(f"Warning: Could not save high scores: {e}")
     
     def display_welcome(self):
         """Display welcome message and instructions."""
@@ -269,21 +412,23 @@ class QuizApp:
         """Display available quiz categories."""
         print("📚 Available Categories:")
         print("-" * 30)
-        for i, (category_name, category) in enumerate(self.categories.items(), 1):
-            print(f"{i}. {category_name} ({len(category.questions)} questions)")
+        for line in self._category_menu_lines:
+            print(line)
         print()
     
     def get_user_choice(self, prompt: str, min_val: int, max_val: int) -> int:
         """Get a valid integer choice from user within specified range."""
         while True:
-            try:
-                choice = int(input(prompt))
-                if min_val <= choice <= max_val:
-                    return choice
-                else:
-                    print(f"Please enter a number between {min_val} and {max_val}.")
-            except ValueError:
+            text = input(prompt).strip()
+            # isdecimal() accepts exactly the strings int() parses as plain digits
+            if not text.isdecimal():
                 print("Please enter a valid number.")
+                continue
+            
+            choice = int(text)
+            if min_val <= choice <= max_val:
+                return choice
+            print(f"Please enter a number between {min_val} and {max_val}.")
     
     def select_category(self) -> QuizCategory:
         """Let user select a quiz category."""
@@ -292,10 +437,10 @@ class QuizApp:
         choice = self.get_user_choice(
             "Select a category (enter number): ",
             1,
-            len(self.categories)
+            self._num_categories
         )
         
-        category_name = list(self.categories.keys())[choice - 1]
+        category_name = self._category_names[choice - 1]
         return self.categories[category_name]
     
     def select_num_questions(self, max_questions: int) -> int:
@@ -312,15 +457,16 @@ class QuizApp:
     
     def display_question(self, question: QuizQuestion, question_num: int, total_questions: int):
         """Display a quiz question with options."""
-        print("\n" + "=" * 60)
-        print(f"Question {question_num}/{total_questions}")
-        print("=" * 60)
-        print(f"❓ {question.question}")
-        print()
-        
-        for i, option in enumerate(question.options, 1):
-            print(f"{i}. {option}")
-        print()
+        lines = [
+            "\n" + "=" * 60,
+            f"Question {question_num}/{total_questions}",
+            "=" * 60,
+            f"❓ {question.question}",
+            "",
+        ]
+        lines.extend(f"{i}. {option}" for i, option in enumerate(question.options, 1))
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_answer(self, num_options: int) -> int:
         """Get user's answer choice."""
@@ -330,91 +476,112 @@ class QuizApp:
             num_options
         ) - 1  # Convert to 0-based index
     
-    def display_answer_feedback(self, is_correct: bool, question: QuizQuestion, user_answer_index: int):
-        """Display feedback for the user's answer."""
+    def display_answer_feedback(self, is_correct: bool, question: QuizQuestion, user_answer_index: int,
+                                session: Optional[QuizSession] = None):
+        """Display feedback for the user's answer, or buffer it in non-interactive mode."""
         if is_correct:
-            print("✅ Correct! Well done!")
+            lines = ["✅ Correct! Well done!"]
         else:
-            print("❌ Incorrect!")
-            print(f"Your answer: {question.options[user_answer_index]}")
-            print(f"Correct answer: {question.get_correct_answer_text()}")
+            lines = [
+                "❌ Incorrect!",
+                f"Your answer: {question.options[user_answer_index]}",
+                f"Correct answer: {question.get_correct_answer_text()}",
+            ]
         
         if question.explanation:
-            print(f"📖 Explanation: {question.explanation}")
+            lines.append(f"📖 Explanation: {question.explanation}")
+        
+        if not self.interactive and session is not None:
+            session.feedback_log.append(
+                f"\n{session.current_question}. {question.question}\n" + "\n".join(lines)
+            )
+            return
         
-        input("\nPress Enter to continue...")
+        sys.stdout.write("\n".join(lines) + "\n")
+        if self.interactive:
+            input("\nPress Enter to continue...")
     
     def display_final_results(self, session: QuizSession):
         """Display final quiz results and statistics."""
-        print("\n" + "🎉" * 20)
-        print("QUIZ COMPLETED!")
-        print("🎉" * 20)
+        if session.feedback_log:
+            sys.stdout.write("\n".join(session.feedback_log) + "\n")
         
+        total_questions = len(session.questions)
         percentage = session.get_score_percentage()
-        print(f"\n📊 Your Results:")
-        print(f"   Score: {session.score}/{len(session.questions)}")
-        print(f"   Percentage: {percentage:.1f}%")
-        print(f"   Duration: {session.get_duration()}")
-        print(f"   Category: {session.category.name}")
         
         # Performance feedback
         if percentage >= 90:
-            print("\n🏆 Outstanding! You're a quiz master!")
+            feedback = "🏆 Outstanding! You're a quiz master!"
         elif percentage >= 80:
-            print("\n🥇 Excellent work! Great knowledge!")
+            feedback = "🥇 Excellent work! Great knowledge!"
         elif percentage >= 70:
-            print("\n🥈 Good job! Keep it up!")
+            feedback = "🥈 Good job! Keep it up!"
         elif percentage >= 60:
-            print("\n🥉 Not bad! Room for improvement!")
+            feedback = "🥉 Not bad! Room for improvement!"
         else:
-            print("\n📚 Keep studying! You'll do better next time!")
+            feedback = "📚 Keep studying! You'll do better next time!"
+        
+        lines = [
+            "\n" + "🎉" * 20,
+            "QUIZ COMPLETED!",
+            "🎉" * 20,
+            "\n📊 Your Results:",
+            f"   Score: {session.score}/{total_questions}",
+            f"   Percentage: {percentage:.1f}%",
+            f"   Duration: {session.get_duration()}",
+            f"   Category: {session.category.name}",
+            "\n" + feedback,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Add to high scores
         self._add_high_score(
             session.category.name,
             session.score,
-            len(session.questions),
+            total_questions,
             session.get_duration()
         )
     
     def display_answer_review(self, session: QuizSession):
         """Display detailed review of all answers."""
-        print("\n" + "=" * 60)
-        print("📋 ANSWER REVIEW")
-        print("=" * 60)
+        lines = ["\n" + "=" * 60, "📋 ANSWER REVIEW", "=" * 60]
         
         for i, answer_data in enumerate(session.answers, 1):
-            print(f"\n{i}. {answer_data['question']}")
-            print(f"   Your answer: {answer_data['user_answer']}")
-            print(f"   Correct answer: {answer_data['correct_answer']}")
-            print(f"   Result: {'✅ Correct' if answer_data['is_correct'] else '❌ Incorrect'}")
+            lines.append(f"\n{i}. {answer_data['question']}")
+            lines.append(f"   Your answer: {answer_data['user_answer']}")
+            lines.append(f"   Correct answer: {answer_data['correct_answer']}")
+            lines.append(f"   Result: {'✅ Correct' if answer_data['is_correct'] else '❌ Incorrect'}")
             
             if answer_data['explanation']:
-                print(f"   Explanation: {answer_data['explanation']}")
+                lines.append(f"   Explanation: {answer_data['explanation']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_high_scores(self):
         """Display high scores for all categories."""
-        print("\n" + "🏆" * 20)
-        print("HIGH SCORES")
-        print("🏆" * 20)
+        lines = ["\n" + "🏆" * 20, "HIGH SCORES", "🏆" * 20]
         
-        for category, scores in self.high_scores.items():
-            print(f"\n📚 {category}:")
+        for category, scores in self._get_high_scores().items():
+            lines.append(f"\n📚 {category}:")
             if not scores:
-                print("   No scores yet!")
+                lines.append("   No scores yet!")
             else:
                 for i, score in enumerate(scores, 1):
-                    print(f"   {i}. {score['percentage']:.1f}% "
-                          f"({score['score']}/{score['total']}) - "
-                          f"{score['duration']} - {score['date']}")
+                    lines.append(f"   {i}. {score['percentage']:.1f}% "
+                                 f"({score['score']}/{score['total']}) - "
+                                 f"{score['duration']} - {score['date']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def run_quiz(self, category: QuizCategory, num_questions: int):
         """Run a complete quiz session."""
         session = QuizSession(category, num_questions)
+        total_questions = len(session.questions)
         
         print(f"\n🚀 Starting {category.name} Quiz!")
-        print(f"You'll be asked {len(session.questions)} questions.")
-        input("Press Enter to begin...")
+        print(f"You'll be asked {total_questions} questions.")
+        if self.interactive:
+            input("Press Enter to begin...")
         
         # Main quiz loop
         while not session.is_complete():
@@ -422,13 +589,12 @@ class QuizApp:
             if question is None:
                 break
             
-            current, total = session.get_progress()
-            self.display_question(question, current + 1, total)
+            self.display_question(question, session.current_question + 1, total_questions)
             
             answer_index = self.get_answer(len(question.options))
             is_correct = session.submit_answer(answer_index)
             
-            self.display_answer_feedback(is_correct, question, answer_index)
+            self.display_answer_feedback(is_correct, question, answer_index, session)
         
         # Display results
         self.display_final_results(session)
@@ -472,10 +638,14 @@ class QuizApp:
 
 def main():
     """Main entry point of the application."""
+    app = None
     try:
-        app = QuizApp()
+        # --batch skips the "Press Enter" pauses, e.g. for scripted runs
+        app = QuizApp(interactive='--batch' not in sys.argv[1:])
         app.run()
     except KeyboardInterrupt:
+        if app is not None:
+            app._flush_scores()
         print("\n\n👋 Quiz interrupted. Thanks for playing!")
     except Exception as e:
         print(f"\n❌ An error occurred: {e}")
@@ -508,6 +678,14 @@ def run_tests():
     assert session.get_progress() == (0, 2)
     assert session.is_complete() == False
     
+    # Test batched feedback in non-interactive mode
+    app = QuizApp(interactive=False)
+    session = QuizSession(category, 1)
+    question = session.get_current_question()
+    session.submit_answer(question.correct_answer)
+    app.display_answer_feedback(True, question, question.correct_answer, session)
+    assert len(session.feedback_log) == 1
+    
     print("✅ All tests passed!")
 
 
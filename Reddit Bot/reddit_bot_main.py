@@ -23,7 +23,33 @@ from dataclasses import dataclass
 import argparse
 import sys
 import os
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import chain
+
+# Optional fast multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional faster JSON parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sentiment lexicon, matched against whole words
+POSITIVE_WORDS = frozenset({'good', 'great', 'awesome', 'excellent', 'amazing', 'love', 'best'})
+NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'awful', 'hate', 'worst', 'horrible', 'sucks'})
+_POLARITY = {**dict.fromkeys(POSITIVE_WORDS, 1), **dict.fromkeys(NEGATIVE_WORDS, -1)}
+_SENTIMENT_RE = re.compile(r"\b(" + "|".join(sorted(_POLARITY)) + r")\b")
+_PLACEHOLDER_RE = re.compile(r"\{(?:keywords|title)\}")
+
+# Processed post IDs are kept in memory for this many days, reloaded once a day
+PROCESSED_POSTS_DAYS = 7
+PROCESSED_POSTS_REFRESH_SECONDS = 24 * 60 * 60
 
 
 # Configuration and Data Classes
@@ -61,8 +87,20 @@ class RedditBot:
         self.reddit = None
         self.db_connection = None
         self.processed_posts: Set[str] = set()
-        self.comment_count = 0
-        self.last_comment_time = datetime.now()
+        self._processed_posts_loaded_at = time.monotonic()
+        # Processed-post rows waiting to be written by flush_processed_posts
+        self._pending_posts: List[tuple] = []
+        # Monotonic timestamps of comments made within the last hour
+        self._comment_times = deque(maxlen=max(config.max_comments_per_hour, 1))
+        # Case-folded once so matching never re-folds the configured keywords
+        self._keywords = tuple(config.keywords)
+        self._keywords_folded = tuple(keyword.casefold() for keyword in config.keywords)
+        self._keyword_automaton = self._build_keyword_automaton()
+        self._keyword_re, self._keyword_prefixes = self._build_keyword_regex()
+        self._templates = self._compile_templates()
+        # Templates are dealt from a shuffled round so no response repeats back to back
+        self._template_round = iter(())
+        self._last_template = None
         
         # Setup logging
         self.setup_logging()
@@ -92,6 +130,9 @@ class RedditBot:
         """Initialize SQLite database for persistent storage"""
         try:
             self.db_connection = sqlite3.connect('reddit_bot.db')
+            # WAL lets commits append to a log instead of rewriting pages
+            self.db_connection.execute("PRAGMA journal_mode=WAL")
+            self.db_connection.execute("PRAGMA synchronous=NORMAL")
             cursor = self.db_connection.cursor()
             
             # Create tables
@@ -149,86 +190,178 @@ class RedditBot:
             cursor = self.db_connection.cursor()
             cursor.execute(
                 "SELECT post_id FROM processed_posts WHERE processed_at > ?",
-                (datetime.now() - timedelta(days=7),)  # Only load recent posts
+                (datetime.now() - timedelta(days=PROCESSED_POSTS_DAYS),)  # Only load recent posts
             )
             self.processed_posts = {row[0] for row in cursor.fetchall()}
+            self._processed_posts_loaded_at = time.monotonic()
             self.logger.info(f"Loaded {len(self.processed_posts)} previously processed posts")
         except Exception as e:
             self.logger.error(f"Failed to load processed posts: {e}")
     
     def save_processed_post(self, post_id: str, subreddit: str, title: str, action: str):
-        """Save processed post to database"""
+        """Queue a processed post to be saved by the next flush"""
+        self._pending_posts.append((post_id, subreddit, title, datetime.now(), action))
+        self.processed_posts.add(post_id)
+    
+    def flush_processed_posts(self):
+        """Save all queued processed posts to database in one transaction"""
+        if not self._pending_posts:
+            return
+        
         try:
             cursor = self.db_connection.cursor()
-            cursor.execute(
+            cursor.executemany(
                 "INSERT OR REPLACE INTO processed_posts VALUES (?, ?, ?, ?, ?)",
-                (post_id, subreddit, title, datetime.now(), action)
+                self._pending_posts
             )
             self.db_connection.commit()
-            self.processed_posts.add(post_id)
+            self._pending_posts.clear()
         except Exception as e:
-            self.logger.error(f"Failed to save processed post: {e}")
+            self.logger.error(f"Failed to save processed posts: {e}")
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over the case-folded keywords, if available"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        # Keywords that differ only in case share one pattern
+        indices_by_pattern = defaultdict(list)
+        for index, pattern in enumerate(self._keywords_folded):
+            if pattern:
+                indices_by_pattern[pattern].append(index)
+        if not indices_by_pattern:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for pattern, indices in indices_by_pattern.items():
+            automaton.add_word(pattern, tuple(indices))
+        automaton.make_automaton()
+        return automaton
     
-    def contains_keywords(self, text: str) -> List[str]:
+    def _build_keyword_regex(self):
+        """Build a single-scan keyword regex, used when pyahocorasick is unavailable"""
+        if self._keyword_automaton is not None:
+            return None, {}
+        
+        patterns = {pattern for pattern in self._keywords_folded if pattern}
+        if not patterns:
+            return None, {}
+        
+        # The lookahead reports the longest keyword starting at every position;
+        # shorter keywords starting there are its prefixes and are added back
+        # through the prefix table
+        alternation = "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+        keyword_re = re.compile(f"(?=({alternation}))")
+        prefixes = {
+            pattern: tuple(i for i, folded in enumerate(self._keywords_folded)
+                           if folded and pattern.startswith(folded))
+            for pattern in patterns
+        }
+        return keyword_re, prefixes
+    
+    def contains_keywords(self, text: str, text_folded: Optional[str] = None) -> List[str]:
         """Check if text contains any of the configured keywords"""
-        found_keywords = []
-        text_lower = text.lower()
+        if text_folded is None:
+            text_folded = text.casefold()
         
-        for keyword in self.config.keywords:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
+        if self._keyword_automaton is not None:
+            # One pass over the text finds every keyword occurrence
+            matched = set()
+            for _, indices in self._keyword_automaton.iter(text_folded):
+                matched.update(indices)
+            return [self._keywords[i] for i in sorted(matched)]
         
-        return found_keywords
+        if self._keyword_re is not None:
+            matched = set()
+            for pattern in set(self._keyword_re.findall(text_folded)):
+                matched.update(self._keyword_prefixes[pattern])
+            return [self._keywords[i] for i in sorted(matched)]
+        
+        return [keyword for keyword, folded in zip(self._keywords, self._keywords_folded)
+                if folded in text_folded]
     
-    def analyze_sentiment(self, text: str) -> str:
+    def analyze_sentiment(self, text: str, text_folded: Optional[str] = None) -> str:
         """
         Simple sentiment analysis based on keyword matching.
         In a real implementation, you might use NLTK or other libraries.
         """
-        positive_words = ['good', 'great', 'awesome', 'excellent', 'amazing', 'love', 'best']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'worst', 'horrible', 'sucks']
+        if text_folded is None:
+            text_folded = text.casefold()
         
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        # Only lexicon words are matched, so other words are never materialized
+        score = sum(_POLARITY[word] for word in _SENTIMENT_RE.findall(text_folded))
         
-        if positive_count > negative_count:
+        if score > 0:
             return "positive"
-        elif negative_count > positive_count:
+        elif score < 0:
             return "negative"
         else:
             return "neutral"
     
+    def _compile_templates(self) -> List[tuple]:
+        """Record which placeholders each response template uses"""
+        compiled = []
+        for template in self.config.response_templates:
+            uses_keywords = "{keywords}" in template
+            uses_title = "{title}" in template
+            # Templates with any other braces keep the literal replace path,
+            # since format_map would interpret them
+            bare = _PLACEHOLDER_RE.sub("", template)
+            formattable = "{" not in bare and "}" not in bare
+            compiled.append((template, uses_keywords, uses_title, formattable))
+        return compiled
+    
+    def _next_template(self) -> tuple:
+        """Get the next compiled template, reshuffling when a round is used up"""
+        try:
+            compiled = next(self._template_round)
+        except StopIteration:
+            pool = list(self._templates)
+            random.shuffle(pool)
+            # Don't open the new round with the template that closed the last one
+            if len(pool) > 1 and pool[0] is self._last_template:
+                pool[0], pool[-1] = pool[-1], pool[0]
+            self._template_round = iter(pool)
+            compiled = next(self._template_round)
+        
+        self._last_template = compiled
+        return compiled
+    
     def generate_response(self, post_title: str, post_content: str, keywords_found: List[str]) -> str:
         """Generate an appropriate response based on the post content"""
-        templates = self.config.response_templates
-        
-        if not templates:
+        if not self._templates:
             return f"Thanks for mentioning {', '.join(keywords_found)}! This is an automated response."
         
-        # Select a random template and customize it
-        template = random.choice(templates)
+        # Select the next template from the shuffled round and customize it
+        template, uses_keywords, uses_title, formattable = self._next_template()
         
-        # Replace placeholders in template
-        response = template.replace("{keywords}", ", ".join(keywords_found))
-        response = response.replace("{title}", post_title[:50] + "..." if len(post_title) > 50 else post_title)
+        if not formattable:
+            response = template.replace("{keywords}", ", ".join(keywords_found))
+            return response.replace("{title}", post_title[:50] + "..." if len(post_title) > 50 else post_title)
         
-        return response
+        # Only build the values the template actually uses
+        values = {}
+        if uses_keywords:
+            values["keywords"] = ", ".join(keywords_found)
+        if uses_title:
+            values["title"] = post_title[:50] + "..." if len(post_title) > 50 else post_title
+        return template.format_map(values)
     
     def can_make_comment(self) -> bool:
         """Check if bot can make a comment based on rate limiting"""
-        now = datetime.now()
+        now = time.monotonic()
+        comment_times = self._comment_times
         
-        # Reset counter if it's been more than an hour
-        if now - self.last_comment_time > timedelta(hours=1):
-            self.comment_count = 0
+        # Slide the one-hour window forward
+        while comment_times and now - comment_times[0] > 3600:
+            comment_times.popleft()
         
         # Check if we've exceeded the hourly limit
-        if self.comment_count >= self.config.max_comments_per_hour:
+        if len(comment_times) >= self.config.max_comments_per_hour:
             return False
         
         # Check minimum delay between actions
-        if now - self.last_comment_time < timedelta(seconds=self.config.min_delay_between_actions):
+        if comment_times and now - comment_times[-1] < self.config.min_delay_between_actions:
             return False
         
         return True
@@ -245,8 +378,7 @@ class RedditBot:
                 return False
             
             submission.reply(response_text)
-            self.comment_count += 1
-            self.last_comment_time = datetime.now()
+            self._comment_times.append(time.monotonic())
             self.logger.info(f"Successfully commented on post {submission.id}")
             return True
             
@@ -262,41 +394,46 @@ class RedditBot:
     
     def process_submission(self, submission) -> bool:
         """Process a single Reddit submission"""
+        post_id = submission.id
         try:
             # Skip if already processed
-            if submission.id in self.processed_posts:
+            if post_id in self.processed_posts:
                 return False
             
+            # Read each lazily-loaded PRAW attribute once
+            title = submission.title
+            selftext = submission.selftext
+            subreddit_name = submission.subreddit.display_name
+            
             # Combine title and selftext for keyword analysis
-            full_text = f"{submission.title} {submission.selftext}"
-            keywords_found = self.contains_keywords(full_text)
+            full_text = f"{title} {selftext}"
+            # Case-folded once and shared by keyword matching and sentiment analysis
+            text_folded = full_text.casefold()
+            keywords_found = self.contains_keywords(full_text, text_folded)
             
             if not keywords_found:
-                self.save_processed_post(submission.id, submission.subreddit.display_name, 
-                                       submission.title, "no_keywords")
+                self.save_processed_post(post_id, subreddit_name, title, "no_keywords")
                 return False
             
             # Analyze sentiment
-            sentiment = self.analyze_sentiment(full_text)
+            sentiment = self.analyze_sentiment(full_text, text_folded)
             
-            self.logger.info(f"Found keywords {keywords_found} in post {submission.id} "
+            self.logger.info(f"Found keywords {keywords_found} in post {post_id} "
                            f"(sentiment: {sentiment})")
             
             # Generate and post response
-            response = self.generate_response(submission.title, submission.selftext, keywords_found)
+            response = self.generate_response(title, selftext, keywords_found)
             
             if self.make_comment(submission, response):
                 action = f"commented_keywords_{','.join(keywords_found)}_sentiment_{sentiment}"
-                self.save_processed_post(submission.id, submission.subreddit.display_name,
-                                       submission.title, action)
+                self.save_processed_post(post_id, subreddit_name, title, action)
                 return True
             else:
-                self.save_processed_post(submission.id, submission.subreddit.display_name,
-                                       submission.title, "comment_failed")
+                self.save_processed_post(post_id, subreddit_name, title, "comment_failed")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error processing submission {submission.id}: {e}")
+            self.logger.error(f"Error processing submission {post_id}: {e}")
             return False
     
     def monitor_subreddit(self, subreddit_name: str, limit: int = 25) -> Dict[str, int]:
@@ -306,17 +443,20 @@ class RedditBot:
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
             
-            # Monitor both new and hot posts
-            submissions = list(subreddit.new(limit=limit//2)) + list(subreddit.hot(limit=limit//2))
+            # Monitor both new and hot posts; listings are fetched lazily as we go
+            submissions = chain(subreddit.new(limit=limit//2), subreddit.hot(limit=limit//2))
             
             for submission in submissions:
+                # new and hot overlap; every handled post is already in processed_posts
+                if submission.id in self.processed_posts:
+                    continue
+                
                 try:
                     stats["processed"] += 1
                     if self.process_submission(submission):
                         stats["commented"] += 1
-                    
-                    # Small delay between processing posts
-                    time.sleep(2)
+                        # Small delay after posting; skipped posts make no API calls
+                        time.sleep(2)
                     
                 except Exception as e:
                     stats["errors"] += 1
@@ -333,6 +473,8 @@ class RedditBot:
         except Exception as e:
             self.logger.error(f"Error monitoring subreddit {subreddit_name}: {e}")
             stats["errors"] += 1
+        finally:
+            self.flush_processed_posts()
         
         return stats
     
@@ -341,13 +483,20 @@ class RedditBot:
         self.logger.info("Starting monitoring cycle")
         total_stats = defaultdict(int)
         
-        for subreddit_name in self.config.target_subreddits:
+        # Reload the processed posts so a long-running bot keeps only the
+        # recent window in memory, as it does at startup
+        if time.monotonic() - self._processed_posts_loaded_at > PROCESSED_POSTS_REFRESH_SECONDS:
+            self.flush_processed_posts()
+            self.load_processed_posts()
+        
+        for i, subreddit_name in enumerate(self.config.target_subreddits):
+            # Delay between subreddits to avoid overwhelming Reddit's servers
+            if i:
+                time.sleep(10)
+            
             stats = self.monitor_subreddit(subreddit_name)
             for key, value in stats.items():
                 total_stats[key] += value
-            
-            # Delay between subreddits to avoid overwhelming Reddit's servers
-            time.sleep(10)
         
         self.logger.info(f"Monitoring cycle complete. Total stats: {dict(total_stats)}")
         return dict(total_stats)
@@ -378,26 +527,16 @@ class RedditBot:
             today = datetime.now().strftime('%Y-%m-%d')
             cursor = self.db_connection.cursor()
             
-            # Get existing stats for today
-            cursor.execute("SELECT * FROM bot_stats WHERE date = ?", (today,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing record
-                cursor.execute(
-                    "UPDATE bot_stats SET posts_processed = posts_processed + ?, "
-                    "comments_made = comments_made + ?, errors_encountered = errors_encountered + ? "
-                    "WHERE date = ?",
-                    (stats.get('processed', 0), stats.get('commented', 0), 
-                     stats.get('errors', 0), today)
-                )
-            else:
-                # Insert new record
-                cursor.execute(
-                    "INSERT INTO bot_stats VALUES (?, ?, ?, ?)",
-                    (today, stats.get('processed', 0), stats.get('commented', 0), 
-                     stats.get('errors', 0))
-                )
+            # Insert today's record, or add to it if it already exists
+            cursor.execute(
+                "INSERT INTO bot_stats VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET "
+                "posts_processed = posts_processed + excluded.posts_processed, "
+                "comments_made = comments_made + excluded.comments_made, "
+                "errors_encountered = errors_encountered + excluded.errors_encountered",
+                (today, stats.get('processed', 0), stats.get('commented', 0), 
+                 stats.get('errors', 0))
+            )
             
             self.db_connection.commit()
         except Exception as e:
@@ -406,28 +545,27 @@ class RedditBot:
     def get_stats(self, days: int = 7) -> Dict:
         """Get bot statistics for the last N days"""
         try:
+            since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             cursor = self.db_connection.cursor()
             cursor.execute(
                 "SELECT * FROM bot_stats WHERE date >= ? ORDER BY date DESC",
-                ((datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'),)
+                (since,)
             )
             
-            stats = []
-            total_processed = 0
-            total_comments = 0
-            total_errors = 0
+            stats = [
+                {'date': date, 'processed': processed, 'comments': comments, 'errors': errors}
+                for date, processed, comments, errors in cursor.fetchall()
+            ]
             
-            for row in cursor.fetchall():
-                date, processed, comments, errors = row
-                stats.append({
-                    'date': date,
-                    'processed': processed,
-                    'comments': comments,
-                    'errors': errors
-                })
-                total_processed += processed
-                total_comments += comments
-                total_errors += errors
+            # Let SQLite do the summing
+            cursor.execute(
+                "SELECT COUNT(*), COALESCE(SUM(posts_processed), 0), "
+                "COALESCE(SUM(comments_made), 0), COALESCE(SUM(errors_encountered), 0) "
+                "FROM bot_stats WHERE date >= ?",
+                (since,)
+            )
+            num_days, total_processed, total_comments, total_errors = cursor.fetchone()
+            num_days = max(num_days, 1)
             
             return {
                 'daily_stats': stats,
@@ -437,9 +575,9 @@ class RedditBot:
                     'errors': total_errors
                 },
                 'averages': {
-                    'processed_per_day': total_processed / max(len(stats), 1),
-                    'comments_per_day': total_comments / max(len(stats), 1),
-                    'errors_per_day': total_errors / max(len(stats), 1)
+                    'processed_per_day': total_processed / num_days,
+                    'comments_per_day': total_comments / num_days,
+                    'errors_per_day': total_errors / num_days
                 }
             }
         except Exception as e:
@@ -449,6 +587,7 @@ class RedditBot:
     def cleanup(self):
         """Cleanup resources"""
         if self.db_connection:
+            self.flush_processed_posts()
             self.db_connection.close()
         self.logger.info("Bot cleanup completed")
 
@@ -456,8 +595,12 @@ class RedditBot:
 def load_config_from_file(config_path: str) -> BotConfig:
     """Load configuration from JSON file"""
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(config_path, 'rb') as f:
+                config_data = orjson.loads(f.read())
+        else:
+            with open(config_path, 'r') as f:
+                config_data = json.load(f)
         
         return BotConfig(**config_data)
     except FileNotFoundError:
@@ -509,6 +652,8 @@ def main():
                        help='Run once instead of continuously')
     parser.add_argument('--stats', action='store_true',
                        help='Show bot statistics')
+    parser.add_argument('--days', type=int, default=7,
+                       help='Number of days covered by --stats (default: 7)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Run in dry-run mode (no actual comments)')
     
@@ -534,7 +679,7 @@ def main():
         
         if args.stats:
             # Show statistics
-            stats = bot.get_stats()
+            stats = bot.get_stats(args.days)
             print("\n=== Reddit Bot Statistics ===")
             print(f"Total posts processed: {stats['totals']['processed']}")
             print(f"Total comments made: {stats['totals']['comments']}")
@@ -14,6 +14,14 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import time
+import functools
+from collections import defaultdict
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: str, flags: int) -> re.Pattern:
+    """Compile a pattern, reusing the compiled object for repeated queries"""
+    return re.compile(pattern, flags)
 
 
 class OutputFormat(Enum):
@@ -27,6 +35,8 @@ class OutputFormat(Enum):
 @dataclass
 class RegexMatch:
     """Data class to store regex match information"""
+    __slots__ = ('match_text', 'start_pos', 'end_pos', 'groups', 'named_groups')
+    
     match_text: str
     start_pos: int
     end_pos: int
@@ -61,6 +71,8 @@ class RegexQueryTool:
             'a': re.ASCII,
             'l': re.LOCALE
         }
+        # Parsed flag strings, so each distinct string is scanned once
+        self._parsed_flags: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
         self.predefined_patterns = {
             'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
             'phone': r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
@@ -84,15 +96,19 @@ class RegexQueryTool:
         Returns:
             Tuple of compiled flags and list of flag names
         """
-        flags = 0
-        flag_names = []
-        
-        for char in flag_string.lower():
-            if char in self.flag_mapping:
-                flags |= self.flag_mapping[char]
-                flag_names.append(char.upper())
+        parsed = self._parsed_flags.get(flag_string)
+        if parsed is None:
+            flags = 0
+            flag_names = []
+            
+            for char in flag_string.lower():
+                if char in self.flag_mapping:
+                    flags |= self.flag_mapping[char]
+                    flag_names.append(char.upper())
+            
+            parsed = self._parsed_flags[flag_string] = (flags, tuple(flag_names))
         
-        return flags, flag_names
+        return parsed[0], list(parsed[1])
     
     def validate_pattern(self, pattern: str) -> Tuple[bool, Optional[str]]:
         """
@@ -105,7 +121,7 @@ class RegexQueryTool:
             Tuple of (is_valid, error_message)
         """
         try:
-            re.compile(pattern)
+            _compile(pattern, 0)
             return True, None
         except re.error as e:
             return False, str(e)
@@ -143,19 +159,10 @@ class RegexQueryTool:
         
         try:
             # Compile pattern with flags
-            regex = re.compile(pattern, compiled_flags)
+            regex = _compile(pattern, compiled_flags)
             
             # Find all matches
-            matches = []
-            for match in regex.finditer(text):
-                regex_match = RegexMatch(
-                    match_text=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    groups=list(match.groups()),
-                    named_groups=match.groupdict()
-                )
-                matches.append(regex_match)
+            matches = self._collect_matches(regex, text)
             
             execution_time = time.perf_counter() - start_time
             
@@ -181,6 +188,79 @@ class RegexQueryTool:
                 error_message=str(e)
             )
     
+    def find_matches_many(self, patterns: List[str], texts: List[str], flags: str = '') -> List[RegexResult]:
+        """
+        Find all matches for each (pattern, text) pair
+        
+        Pairs are grouped by pattern, so each distinct pattern is validated
+        and compiled once however many texts it is paired with.
+        
+        Args:
+            patterns: Regular expression patterns, one per text
+            texts: Texts to search in
+            flags: Flag string applied to every pattern
+            
+        Returns:
+            List of RegexResult objects, in input order
+        """
+        texts_by_pattern = defaultdict(list)
+        for index, (pattern, text) in enumerate(zip(patterns, texts)):
+            texts_by_pattern[pattern].append((index, text))
+        
+        results: List[Optional[RegexResult]] = [None] * min(len(patterns), len(texts))
+        compiled_flags, flag_names = self.parse_flags(flags)
+        
+        for pattern, indexed_texts in texts_by_pattern.items():
+            is_valid, error_msg = self.validate_pattern(pattern)
+            regex = None
+            if is_valid:
+                try:
+                    regex = _compile(pattern, compiled_flags)
+                except Exception as e:
+                    error_msg = str(e)
+            
+            for index, text in indexed_texts:
+                if regex is None:
+                    results[index] = RegexResult(
+                        pattern=pattern,
+                        text=text,
+                        matches=[],
+                        flags=flag_names if is_valid else [],
+                        execution_time=0,
+                        total_matches=0,
+                        is_valid_pattern=False,
+                        error_message=error_msg
+                    )
+                    continue
+                
+                start_time = time.perf_counter()
+                matches = self._collect_matches(regex, text)
+                results[index] = RegexResult(
+                    pattern=pattern,
+                    text=text,
+                    matches=matches,
+                    flags=flag_names,
+                    execution_time=time.perf_counter() - start_time,
+                    total_matches=len(matches),
+                    is_valid_pattern=True
+                )
+        
+        return results
+    
+    @staticmethod
+    def _collect_matches(regex: re.Pattern, text: str) -> List[RegexMatch]:
+        """Build RegexMatch records for every match of a compiled pattern"""
+        return [
+            RegexMatch(
+                match_text=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                groups=list(match.groups()),
+                named_groups=match.groupdict()
+            )
+            for match in regex.finditer(text)
+        ]
+    
     def format_output(self, result: RegexResult, output_format: OutputFormat) -> str:
         """
         Format the regex result according to specified format
@@ -325,7 +405,7 @@ class RegexQueryTool:
         compiled_flags, flag_names = self.parse_flags(flags)
         
         try:
-            regex = re.compile(pattern, compiled_flags)
+            regex = _compile(pattern, compiled_flags)
             result, num_subs = regex.subn(replacement, text, count=count)
             
             return {
@@ -373,20 +453,24 @@ Examples:
     return parser
 
 
-def interactive_mode(tool: RegexQueryTool):
-    """Run the tool in interactive mode"""
-    print("\n🔍 Regex Query Tool - Interactive Mode")
-    print("Type 'help' for commands, 'quit' to exit\n")
+def _read_line(prompt: str) -> str:
+    """Read a line like input(), but straight from stdin when it is not a terminal"""
+    if sys.stdin.isatty():
+        return input(prompt)
     
-    while True:
-        try:
-            command = input("regex> ").strip()
-            
-            if command.lower() in ['quit', 'exit', 'q']:
-                print("Goodbye!")
-                break
-            elif command.lower() == 'help':
-                print("""
+    # Scripted input: skip input()'s prompt handling and use the buffered reader
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+# Interactive command: a verb, then everything after the first space
+_COMMAND_RE = re.compile(r'(\S+)(?: (.*))?', re.DOTALL)
+
+_INTERACTIVE_HELP = """
 Available commands:
   match <pattern> <text> [flags]     - Find matches
   sub <pattern> <replacement> <text> - Substitute text
@@ -395,51 +479,115 @@ Available commands:
   use <pattern_name> <text>          - Use predefined pattern
   help                              - Show this help
   quit/exit/q                       - Exit interactive mode
-                """)
-            elif command.lower() == 'predefined':
-                print(tool.list_predefined_patterns())
-            elif command.startswith('match '):
-                parts = command.split(' ', 3)
-                if len(parts) >= 3:
-                    pattern, text = parts[1], parts[2]
-                    flags = parts[3] if len(parts) > 3 else ''
-                    result = tool.find_matches(pattern, text, flags)
-                    print(tool.format_output(result, OutputFormat.DETAILED))
-                else:
-                    print("Usage: match <pattern> <text> [flags]")
-            elif command.startswith('sub '):
-                parts = command.split(' ', 4)
-                if len(parts) >= 4:
-                    pattern, replacement, text = parts[1], parts[2], parts[3]
-                    result = tool.substitute_text(pattern, replacement, text)
-                    if result['error']:
-                        print(f"❌ Error: {result['error']}")
-                    else:
-                        print(f"✅ Made {result['count']} substitution(s)")
-                        print(f"Result: {result['result']}")
-                else:
-                    print("Usage: sub <pattern> <replacement> <text>")
-            elif command.startswith('validate '):
-                pattern = command[9:]
-                is_valid, error = tool.validate_pattern(pattern)
-                if is_valid:
-                    print("✅ Valid regex pattern")
-                else:
-                    print(f"❌ Invalid pattern: {error}")
-            elif command.startswith('use '):
-                parts = command.split(' ', 2)
-                if len(parts) >= 3:
-                    pattern_name, text = parts[1], parts[2]
-                    pattern = tool.get_predefined_pattern(pattern_name)
-                    if pattern:
-                        result = tool.find_matches(pattern, text)
-                        print(tool.format_output(result, OutputFormat.DETAILED))
-                    else:
-                        print(f"❌ Unknown predefined pattern: {pattern_name}")
-                else:
-                    print("Usage: use <pattern_name> <text>")
-            else:
+                """
+
+
+def _cmd_quit(tool: RegexQueryTool, args: str) -> bool:
+    """Leave interactive mode"""
+    print("Goodbye!")
+    return True
+
+
+def _cmd_help(tool: RegexQueryTool, args: str) -> bool:
+    """Show the interactive command list"""
+    print(_INTERACTIVE_HELP)
+    return False
+
+
+def _cmd_predefined(tool: RegexQueryTool, args: str) -> bool:
+    """List the predefined patterns"""
+    print(tool.list_predefined_patterns())
+    return False
+
+
+def _cmd_match(tool: RegexQueryTool, args: str) -> bool:
+    """Find matches: match <pattern> <text> [flags]"""
+    parts = args.split(' ', 2)
+    if len(parts) >= 2:
+        pattern, text = parts[0], parts[1]
+        flags = parts[2] if len(parts) > 2 else ''
+        result = tool.find_matches(pattern, text, flags)
+        print(tool.format_output(result, OutputFormat.DETAILED))
+    else:
+        print("Usage: match <pattern> <text> [flags]")
+    return False
+
+
+def _cmd_sub(tool: RegexQueryTool, args: str) -> bool:
+    """Substitute text: sub <pattern> <replacement> <text>"""
+    parts = args.split(' ', 3)
+    if len(parts) >= 3:
+        pattern, replacement, text = parts[0], parts[1], parts[2]
+        result = tool.substitute_text(pattern, replacement, text)
+        if result['error']:
+            print(f"❌ Error: {result['error']}")
+        else:
+            print(f"✅ Made {result['count']} substitution(s)")
+            print(f"Result: {result['result']}")
+    else:
+        print("Usage: sub <pattern> <replacement> <text>")
+    return False
+
+
+def _cmd_validate(tool: RegexQueryTool, args: str) -> bool:
+    """Validate a pattern: validate <pattern>"""
+    if not args:
+        print("Usage: validate <pattern>")
+        return False
+    
+    is_valid, error = tool.validate_pattern(args)
+    if is_valid:
+        print("✅ Valid regex pattern")
+    else:
+        print(f"❌ Invalid pattern: {error}")
+    return False
+
+
+def _cmd_use(tool: RegexQueryTool, args: str) -> bool:
+    """Match with a predefined pattern: use <pattern_name> <text>"""
+    parts = args.split(' ', 1)
+    if len(parts) >= 2:
+        pattern_name, text = parts[0], parts[1]
+        pattern = tool.get_predefined_pattern(pattern_name)
+        if pattern:
+            result = tool.find_matches(pattern, text)
+            print(tool.format_output(result, OutputFormat.DETAILED))
+        else:
+            print(f"❌ Unknown predefined pattern: {pattern_name}")
+    else:
+        print("Usage: use <pattern_name> <text>")
+    return False
+
+
+# Command verb -> handler; a handler returns True to leave interactive mode
+_INTERACTIVE_COMMANDS = {
+    'quit': _cmd_quit,
+    'exit': _cmd_quit,
+    'q': _cmd_quit,
+    'help': _cmd_help,
+    'predefined': _cmd_predefined,
+    'match': _cmd_match,
+    'sub': _cmd_sub,
+    'validate': _cmd_validate,
+    'use': _cmd_use,
+}
+
+
+def interactive_mode(tool: RegexQueryTool):
+    """Run the tool in interactive mode"""
+    print("\n🔍 Regex Query Tool - Interactive Mode")
+    print("Type 'help' for commands, 'quit' to exit\n")
+    
+    while True:
+        try:
+            command = _read_line("regex> ").strip()
+            
+            parsed = _COMMAND_RE.fullmatch(command)
+            handler = parsed and _INTERACTIVE_COMMANDS.get(parsed.group(1).lower())
+            if not handler:
                 print("Unknown command. Type 'help' for available commands.")
+            elif handler(tool, parsed.group(2) or ''):
+                break
                 
         except KeyboardInterrupt:
             print("\nGoodbye!")
@@ -532,6 +680,12 @@ def run_tests():
     assert "Replace X and 456" == sub_result['result']
     print("✅ Test 4 passed: Substitution")
     
+    # Test 5: Batched matching
+    results = tool.find_matches_many([r'\d+', r'[', r'\d+'], ["a1b22", "x", "none"])
+    assert [r.total_matches for r in results] == [2, 0, 0]
+    assert not results[1].is_valid_pattern
+    print("✅ Test 5 passed: Batched matching")
+    
     print("\n🎉 All tests passed!")
 
 
@@ -7,20 +7,58 @@ Includes single player vs computer and multiplayer modes.
 
 import random
 import sys
-from typing import Dict, List, Tuple, Optional
+from typing import List, Tuple, Optional
 from collections import defaultdict
+from dataclasses import dataclass
+
+
+# Game constants
+CHOICES = ('rock', 'paper', 'scissors')
+CHOICES_SET = frozenset(CHOICES)
+BEATS = {
+    'rock': 'scissors',
+    'paper': 'rock',
+    'scissors': 'paper'
+}
+# Each choice beats the one before it in CHOICES, so the winner is
+# _OUTCOMES[(player - computer) % 3] on the choice indices
+_CHOICE_INDEX = {choice: i for i, choice in enumerate(CHOICES)}
+_OUTCOMES = ('tie', 'player', 'computer')
+# Display names, computed once instead of per printed round
+_CAP = {choice: choice.capitalize() for choice in CHOICES}
+
+
+def _read_line(prompt: str) -> str:
+    """Read a line like input(), but straight from stdin when it is not a terminal."""
+    if sys.stdin.isatty():
+        return input(prompt)
+    
+    # Scripted input: skip input()'s prompt handling and use the buffered reader
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+@dataclass
+class GameRound:
+    """A single played round, kept in the game history."""
+    __slots__ = ('player_choice', 'computer_choice', 'winner', 'player_name')
+    
+    player_choice: str
+    computer_choice: str
+    winner: str
+    player_name: str
 
 
 class RockPaperScissorsGame:
     """Main game class handling all Rock Paper Scissors logic."""
     
-    # Game constants
-    CHOICES = ['rock', 'paper', 'scissors']
-    WINNING_COMBINATIONS = {
-        'rock': 'scissors',
-        'paper': 'rock',
-        'scissors': 'paper'
-    }
+    # Game constants (aliases of the module-level tables)
+    CHOICES = CHOICES
+    WINNING_COMBINATIONS = BEATS
     
     def __init__(self):
         """Initialize the game with empty statistics."""
@@ -30,20 +68,31 @@ class RockPaperScissorsGame:
             'ties': 0,
             'total_games': 0
         }
-        self.game_history: List[Dict] = []
+        self.game_history: List[GameRound] = []
+        self._menu = {
+            '1': self._single_player_mode,
+            '2': self._multiplayer_mode,
+            '3': self._best_of_3_mode,
+            '4': self._best_of_5_mode,
+            '5': self._stats_mode,
+            '6': self._quit_mode
+        }
     
     def display_welcome(self) -> None:
         """Display welcome message and game rules."""
-        print("=" * 50)
-        print("🎮 WELCOME TO ROCK PAPER SCISSORS! 🎮")
-        print("=" * 50)
-        print("\nGame Rules:")
-        print("• Rock crushes Scissors")
-        print("• Scissors cuts Paper")
-        print("• Paper covers Rock")
-        print("\nChoices: rock, paper, scissors")
-        print("Commands: 'quit' to exit, 'stats' to see statistics")
-        print("=" * 50)
+        lines = [
+            "=" * 50,
+            "🎮 WELCOME TO ROCK PAPER SCISSORS! 🎮",
+            "=" * 50,
+            "\nGame Rules:",
+            "• Rock crushes Scissors",
+            "• Scissors cuts Paper",
+            "• Paper covers Rock",
+            "\nChoices: rock, paper, scissors",
+            "Commands: 'quit' to exit, 'stats' to see statistics",
+            "=" * 50,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_player_choice(self, player_name: str = "Player") -> Optional[str]:
         """
@@ -57,7 +106,7 @@ class RockPaperScissorsGame:
         """
         while True:
             try:
-                choice = input(f"\n{player_name}, enter your choice: ").lower().strip()
+                choice = _read_line(f"\n{player_name}, enter your choice: ").lower().strip()
                 
                 # Handle special commands
                 if choice == 'quit':
@@ -65,10 +114,10 @@ class RockPaperScissorsGame:
                 elif choice == 'stats':
                     self.display_stats()
                     continue
-                elif choice in self.CHOICES:
+                elif choice in CHOICES_SET:
                     return choice
                 else:
-                    print(f"❌ Invalid choice! Please enter: {', '.join(self.CHOICES)}")
+                    print(f"❌ Invalid choice! Please enter: {', '.join(CHOICES)}")
                     
             except (EOFError, KeyboardInterrupt):
                 print("\n\n👋 Thanks for playing!")
@@ -76,7 +125,7 @@ class RockPaperScissorsGame:
     
     def get_computer_choice(self) -> str:
         """Generate random computer choice."""
-        return random.choice(self.CHOICES)
+        return CHOICES[random.randrange(3)]
     
     def determine_winner(self, player_choice: str, computer_choice: str) -> str:
         """
@@ -89,18 +138,14 @@ class RockPaperScissorsGame:
         Returns:
             'player', 'computer', or 'tie'
         """
-        if player_choice == computer_choice:
-            return 'tie'
-        elif self.WINNING_COMBINATIONS[player_choice] == computer_choice:
-            return 'player'
-        else:
-            return 'computer'
+        index = _CHOICE_INDEX
+        return _OUTCOMES[(index[player_choice] - index[computer_choice]) % 3]
     
     def display_round_result(self, player_choice: str, computer_choice: str, 
                            winner: str, player_name: str = "Player") -> None:
         """Display the result of a single round."""
-        print(f"\n{player_name}: {player_choice.capitalize()}")
-        print(f"Computer: {computer_choice.capitalize()}")
+        print(f"\n{player_name}: {_CAP[player_choice]}")
+        print(f"Computer: {_CAP[computer_choice]}")
         print("-" * 30)
         
         if winner == 'tie':
@@ -122,18 +167,23 @@ class RockPaperScissorsGame:
     
     def display_stats(self) -> None:
         """Display current game statistics."""
-        print("\n" + "=" * 30)
-        print("📊 GAME STATISTICS")
-        print("=" * 30)
-        print(f"Total Games: {self.stats['total_games']}")
-        print(f"Player Wins: {self.stats['player_wins']}")
-        print(f"Computer Wins: {self.stats['computer_wins']}")
-        print(f"Ties: {self.stats['ties']}")
+        stats = self.stats
+        lines = [
+            "\n" + "=" * 30,
+            "📊 GAME STATISTICS",
+            "=" * 30,
+            f"Total Games: {stats['total_games']}",
+            f"Player Wins: {stats['player_wins']}",
+            f"Computer Wins: {stats['computer_wins']}",
+            f"Ties: {stats['ties']}",
+        ]
         
-        if self.stats['total_games'] > 0:
-            win_rate = (self.stats['player_wins'] / self.stats['total_games']) * 100
-            print(f"Win Rate: {win_rate:.1f}%")
-        print("=" * 30)
+        if stats['total_games'] > 0:
+            win_rate = (stats['player_wins'] / stats['total_games']) * 100
+            lines.append(f"Win Rate: {win_rate:.1f}%")
+        lines.append("=" * 30)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def play_single_round(self, player_name: str = "Player") -> bool:
         """
@@ -145,10 +195,22 @@ class RockPaperScissorsGame:
         Returns:
             True to continue playing, False to quit
         """
+        return self._play_round(player_name) is not None
+    
+    def _play_round(self, player_name: str = "Player") -> Optional[str]:
+        """
+        Play a round against the computer, recording stats and history.
+        
+        Args:
+            player_name: Name of the player
+            
+        Returns:
+            'player', 'computer' or 'tie', or None if the player quit
+        """
         # Get player choice
         player_choice = self.get_player_choice(player_name)
         if player_choice is None:
-            return False
+            return None
         
         # Get computer choice
         computer_choice = self.get_computer_choice()
@@ -163,14 +225,9 @@ class RockPaperScissorsGame:
         self.update_stats(winner)
         
         # Store game history
-        self.game_history.append({
-            'player_choice': player_choice,
-            'computer_choice': computer_choice,
-            'winner': winner,
-            'player_name': player_name
-        })
+        self.game_history.append(GameRound(player_choice, computer_choice, winner, player_name))
         
-        return True
+        return winner
     
     def play_multiplayer_round(self, player1_name: str, player2_name: str) -> bool:
         """
@@ -195,13 +252,14 @@ class RockPaperScissorsGame:
             return False
         
         # Determine winner
-        print(f"\n{player1_name}: {player1_choice.capitalize()}")
-        print(f"{player2_name}: {player2_choice.capitalize()}")
+        print(f"\n{player1_name}: {_CAP[player1_choice]}")
+        print(f"{player2_name}: {_CAP[player2_choice]}")
         print("-" * 30)
         
-        if player1_choice == player2_choice:
+        winner = self.determine_winner(player1_choice, player2_choice)
+        if winner == 'tie':
             print("🤝 It's a tie!")
-        elif self.WINNING_COMBINATIONS[player1_choice] == player2_choice:
+        elif winner == 'player':
             print(f"🎉 {player1_name} wins this round!")
         else:
             print(f"🎉 {player2_name} wins this round!")
@@ -232,27 +290,66 @@ class RockPaperScissorsGame:
             print(f"\n--- Round {round_num} ---")
             print(f"Score: Player {player_series_wins} - {computer_series_wins} Computer")
             
-            if not self.play_single_round():
+            winner = self._play_round()
+            if winner is None:
                 break
             
-            # Check last game result
-            if self.game_history[-1]['winner'] == 'player':
+            if winner == 'player':
                 player_series_wins += 1
-            elif self.game_history[-1]['winner'] == 'computer':
+            elif winner == 'computer':
                 computer_series_wins += 1
             
             round_num += 1
         
         # Announce series winner
-        print(f"\n🏆 SERIES COMPLETE!")
-        print(f"Final Score: Player {player_series_wins} - {computer_series_wins} Computer")
-        
         if player_series_wins > computer_series_wins:
-            print("🎉 Player wins the series!")
+            verdict = "🎉 Player wins the series!"
         elif computer_series_wins > player_series_wins:
-            print("🤖 Computer wins the series!")
+            verdict = "🤖 Computer wins the series!"
         else:
-            print("🤝 Series tied!")
+            verdict = "🤝 Series tied!"
+        
+        sys.stdout.write(
+            "\n🏆 SERIES COMPLETE!\n"
+            f"Final Score: Player {player_series_wins} - {computer_series_wins} Computer\n"
+            f"{verdict}\n"
+        )
+    
+    def _single_player_mode(self) -> bool:
+        """Menu option 1: play rounds against the computer until the player quits."""
+        print("\n🎮 Single Player Mode")
+        while self.play_single_round():
+            pass
+        return True
+    
+    def _multiplayer_mode(self) -> bool:
+        """Menu option 2: play rounds between two named players."""
+        print("\n👥 Multiplayer Mode")
+        player1 = _read_line("Enter Player 1 name: ").strip() or "Player 1"
+        player2 = _read_line("Enter Player 2 name: ").strip() or "Player 2"
+        
+        while self.play_multiplayer_round(player1, player2):
+            pass
+        return True
+    
+    def _best_of_3_mode(self) -> bool:
+        """Menu option 3: best of 3 series."""
+        self.play_best_of_series(3)
+        return True
+    
+    def _best_of_5_mode(self) -> bool:
+        """Menu option 4: best of 5 series."""
+        self.play_best_of_series(5)
+        return True
+    
+    def _stats_mode(self) -> bool:
+        """Menu option 5: view statistics."""
+        self.display_stats()
+        return True
+    
+    def _quit_mode(self) -> bool:
+        """Menu option 6: leave the main loop."""
+        return False
     
     def run_game(self) -> None:
         """Main game loop."""
@@ -270,41 +367,13 @@ class RockPaperScissorsGame:
             print("=" * 30)
             
             try:
-                choice = input("Select game mode (1-6): ").strip()
-                
-                if choice == '1':
-                    # Single player mode
-                    print("\n🎮 Single Player Mode")
-                    while self.play_single_round():
-                        pass
-                
-                elif choice == '2':
-                    # Multiplayer mode
-                    print("\n👥 Multiplayer Mode")
-                    player1 = input("Enter Player 1 name: ").strip() or "Player 1"
-                    player2 = input("Enter Player 2 name: ").strip() or "Player 2"
-                    
-                    while self.play_multiplayer_round(player1, player2):
-                        pass
-                
-                elif choice == '3':
-                    # Best of 3
-                    self.play_best_of_series(3)
-                
-                elif choice == '4':
-                    # Best of 5
-                    self.play_best_of_series(5)
+                choice = _read_line("Select game mode (1-6): ").strip()
                 
-                elif choice == '5':
-                    # View statistics
-                    self.display_stats()
-                
-                elif choice == '6':
-                    # Quit
-                    break
-                
-                else:
+                handler = self._menu.get(choice)
+                if handler is None:
                     print("❌ Invalid choice! Please enter 1-6.")
+                elif not handler():
+                    break
                     
             except (EOFError, KeyboardInterrupt):
                 break
@@ -8,34 +8,339 @@ Version: 1.0.0
 Python: 3.8+
 """
 
-import urllib.request
+import http.client
+import io
 import urllib.parse
-import urllib.error
 import socket
 import ssl
 import time
 import json
 import argparse
+import os
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
 import re
 
+try:
+    import dns.resolver
+    DNSPYTHON_AVAILABLE = True
+except ImportError:
+    DNSPYTHON_AVAILABLE = False
+
+
+# Shared TLS settings for SSL and HTTPS probes (loading the CA bundle is costly)
+_SSL_CONTEXT = ssl.create_default_context()
+_HTTP_CONNECTIONS = {
+    'http': http.client.HTTPConnection,
+    'https': http.client.HTTPSConnection
+}
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+# Idle keep-alive connections kept per (scheme, host)
+_MAX_IDLE_CONNECTIONS = 4
+# Failures of a reused keep-alive connection that the server may have closed
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+# Prefix of HTTP check errors raised by the connection or socket
+_URL_ERROR_LABEL = "URL Error: "
+# time.monotonic() by which the check running on this thread must finish
+_check_deadline = threading.local()
+
+# Seconds a resolved address is reused before it is looked up again
+_DNS_CACHE_TTL = 300
+
+# Where the command line keeps successful check results between runs
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'site_checker.json')
+
+# Month abbreviations used in certificate validity dates
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+
+def _system_lookup(hostname: str) -> str:
+    """Resolve hostname to an IPv4 address with the system resolver."""
+    addresses = socket.getaddrinfo(hostname, None, socket.AF_INET, socket.SOCK_STREAM)
+    return addresses[0][4][0]
+
+
+def _nameserver_lookup(hostname: str, nameserver: str, timeout: float) -> str:
+    """Resolve hostname to an IPv4 address by asking one DNS server directly."""
+    resolver = dns.resolver.Resolver(configure=False)
+    resolver.nameservers = [nameserver]
+    return resolver.resolve(hostname, 'A', lifetime=timeout)[0].address
+
+
+def _lookup(hostname: str, timeout: float, nameservers: Tuple[str, ...]) -> str:
+    """
+    Resolve hostname, racing the system resolver against extra DNS servers.
+    
+    The first successful answer wins, so one slow resolver does not hold up
+    the check. Without nameservers (or dnspython) only the system resolver
+    is used.
+    
+    Args:
+        hostname (str): Hostname to resolve
+        timeout (float): Time allowed for each DNS server query
+        nameservers (Tuple[str, ...]): Extra DNS server addresses
+        
+    Returns:
+        str: IPv4 address
+    """
+    if not nameservers or not DNSPYTHON_AVAILABLE:
+        return _system_lookup(hostname)
+    
+    executor = ThreadPoolExecutor(max_workers=len(nameservers) + 1)
+    try:
+        system_future = executor.submit(_system_lookup, hostname)
+        futures = [system_future]
+        futures.extend(executor.submit(_nameserver_lookup, hostname, nameserver, timeout)
+                       for nameserver in nameservers)
+        
+        for future in as_completed(futures):
+            if future.exception() is None:
+                return future.result()
+        
+        # Every resolver failed; report the system resolver's error
+        return system_future.result()
+    finally:
+        # Slower lookups are left to finish in the background
+        executor.shutdown(wait=False)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(hostname: str, timeout: float, nameservers: Tuple[str, ...],
+                    ttl_bucket: int) -> Tuple[str, int]:
+    """Resolve and time a lookup; ttl_bucket only makes cache entries expire."""
+    start_time = time.perf_counter_ns()
+    ip_address = _lookup(hostname, timeout, nameservers)
+    resolution_time = (time.perf_counter_ns() - start_time) // 1_000_000
+    return ip_address, resolution_time
+
+
+def _resolve(hostname: str, timeout: float = 10,
+             nameservers: Tuple[str, ...] = ()) -> Tuple[str, int]:
+    """
+    Resolve hostname to an IPv4 address, reusing answers for up to _DNS_CACHE_TTL seconds.
+    
+    Args:
+        hostname (str): Hostname to resolve
+        timeout (float): Time allowed for each DNS server query
+        nameservers (Tuple[str, ...]): Extra DNS servers to race against the system resolver
+        
+    Returns:
+        Tuple[str, int]: IP address and the lookup time in whole milliseconds
+    """
+    return _resolve_cached(hostname, timeout, nameservers,
+                           int(time.monotonic() // _DNS_CACHE_TTL))
+
+
+def _cached_note(check: Dict[str, any]) -> str:
+    """Return the suffix marking a check result that came from the cache."""
+    return " (cached)" if check.get('cached') else ""
+
+
+def _parse_cert_time(value: str) -> datetime:
+    """
+    Parse a certificate date such as 'Jun  1 12:00:00 2025 GMT'.
+    
+    Equivalent to strptime with '%b %d %H:%M:%S %Y %Z' for the fixed
+    format returned by getpeercert(), without the format parsing.
+    
+    Args:
+        value (str): Date string from a certificate
+        
+    Returns:
+        datetime: Parsed (naive) date
+    """
+    month, day, clock, year, _ = value.split()
+    hour, minute, second = clock.split(':')
+    return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+
+
+class _TimedCheck:
+    """A check submitted to the pool whose time budget starts when it runs."""
+    
+    def __init__(self, executor: ThreadPoolExecutor, budget: float, call: Tuple):
+        """
+        Submit a check.
+        
+        Args:
+            executor (ThreadPoolExecutor): Pool to run the check on
+            budget (float): Seconds the check may run once started
+            call (Tuple): Check function followed by its arguments
+        """
+        self.budget = budget
+        self.started = threading.Event()
+        self.started_at = None
+        self.future = executor.submit(self._run, *call)
+    
+    def _run(self, check, *args):
+        """Note the start time and deadline, then run the check."""
+        self.started_at = time.monotonic()
+        _check_deadline.at = self.started_at + self.budget
+        self.started.set()
+        try:
+            return check(*args)
+        finally:
+            _check_deadline.at = None
+    
+    def result(self, queue_limit: float) -> Dict[str, any]:
+        """
+        Wait for the check's result.
+        
+        Time spent queued behind other checks is not charged to the budget,
+        but waiting longer than queue_limit for a worker gives up.
+        
+        Args:
+            queue_limit (float): Seconds to wait for the check to start
+            
+        Returns:
+            Dict: Check result, or a failed result if it did not start or
+            finish in time
+        """
+        if not self.started.wait(queue_limit):
+            return {'success': False, 'error': f"Check did not start within {queue_limit}s"}
+        try:
+            return self.future.result(timeout=max(0, self.started_at + self.budget - time.monotonic()))
+        except FutureTimeoutError:
+            # A running check cannot be interrupted; its own timeouts end it
+            return {'success': False, 'error': f"Check did not finish within {self.budget}s"}
+
 
 class SiteConnectivityChecker:
     """Main class for checking site connectivity and health."""
     
-    def __init__(self, timeout: int = 10, user_agent: str = None):
+    def __init__(self, timeout: int = 10, user_agent: str = None, http_method: str = 'HEAD',
+                 verbose: bool = False, max_workers: int = 32,
+                 site_budget: Optional[float] = None,
+                 dns_servers: Optional[List[str]] = None,
+                 cache_file: Optional[str] = None, cache_ttl: float = 60):
         """
         Initialize the connectivity checker.
         
         Args:
             timeout (int): Request timeout in seconds
             user_agent (str): Custom user agent string
+            http_method (str): Method for the HTTP check ('HEAD' or 'GET')
+            verbose (bool): Include all response headers in HTTP results
+            max_workers (int): Number of sites checked at the same time
+            site_budget (float): Wall-clock seconds each check of a site may
+                run once it starts (default: timeout + 1)
+            dns_servers (List[str]): Extra DNS servers queried alongside the
+                system resolver; the first answer wins (requires dnspython)
+            cache_file (str): JSON file of successful check results reused
+                across runs (default: no cache)
+            cache_ttl (float): Seconds a cached result stays valid
         """
         self.timeout = timeout
         self.user_agent = user_agent or "SiteConnectivityChecker/1.0"
+        self.http_method = http_method
+        self.verbose = verbose
+        self.max_workers = max(1, max_workers)
+        self.site_budget = site_budget if site_budget is not None else timeout + 1
+        # A check past its budget sends no further requests, so it frees its
+        # worker within one connect and one read timeout
+        self._queue_limit = self.site_budget + 2 * timeout
+        self.dns_servers = tuple(dns_servers or ())
         self.results = []
+        # Runs the DNS, SSL and HTTP checks of every site in flight
+        self._executor = ThreadPoolExecutor(max_workers=3 * self.max_workers)
+        # Keep-alive HTTP connections reused across sites, redirects and retries
+        self._idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+        # Successful check results by key, as {'result': ..., 'expires': ...}
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Dict[str, any]] = self._load_cache() if cache_file else {}
+        self._cache_lock = threading.Lock()
+    
+    def _load_cache(self) -> Dict[str, Dict[str, any]]:
+        """
+        Load unexpired entries from the cache file, if it is readable.
+        
+        A file that is not a cache, or entries in the wrong shape, are
+        ignored rather than trusted, so a damaged file cannot stop the run.
+        """
+        try:
+            with open(self.cache_file, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(entries, dict):
+            return {}
+        
+        now = time.time()
+        return {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get('result'), dict)
+            and isinstance(entry.get('expires'), (int, float))
+            and entry['expires'] > now
+        }
+    
+    def _save_cache(self) -> None:
+        """Write the cache file, replacing it atomically."""
+        with self._cache_lock:
+            entries = dict(self._cache)
+        
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(entries, f, default=str)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Warning: could not save cache to {self.cache_file}: {e}")
+    
+    def _cached(self, key: str, check, *args) -> Dict[str, any]:
+        """
+        Return a fresh cached result for key, or run the check.
+        
+        Only successful results are cached, so failing hosts are probed again
+        on every run.
+        
+        Args:
+            key (str): Cache key naming the check and its target
+            check: Check method to run on a cache miss
+            *args: Arguments for the check
+            
+        Returns:
+            Dict: Check result; cached results carry 'cached': True
+        """
+        if not self.cache_file:
+            return check(*args)
+        
+        entry = self._cache.get(key)
+        if entry is not None and entry.get('expires', 0) > time.time():
+            return dict(entry.get('result', {}), cached=True)
+        
+        result = check(*args)
+        if result.get('success'):
+            with self._cache_lock:
+                self._cache[key] = {'result': result, 'expires': time.time() + self.cache_ttl}
+        return result
+    
+    def close(self) -> None:
+        """Save the result cache, close pooled HTTP connections and stop the worker threads."""
+        if self.cache_file:
+            self._save_cache()
+        
+        with self._pool_lock:
+            idle_connections = self._idle_connections
+            self._idle_connections = {}
+        for connections in idle_connections.values():
+            for connection in connections:
+                connection.close()
+        self._executor.shutdown()
     
     def validate_url(self, url: str) -> str:
         """
@@ -75,9 +380,7 @@ class SiteConnectivityChecker:
             Dict: DNS resolution results
         """
         try:
-            start_time = time.time()
-            ip_address = socket.gethostbyname(hostname)
-            resolution_time = round((time.time() - start_time) * 1000, 2)
+            ip_address, resolution_time = _resolve(hostname, self.timeout, self.dns_servers)
             
             return {
                 'success': True,
@@ -105,11 +408,13 @@ class SiteConnectivityChecker:
             Dict: Port connectivity results
         """
         try:
-            start_time = time.time()
+            # Connect to the cached address so the kernel does no second lookup
+            ip_address, _ = _resolve(hostname, self.timeout, self.dns_servers)
+            start_time = time.perf_counter_ns()
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(self.timeout)
-            result = sock.connect_ex((hostname, port))
-            connection_time = round((time.time() - start_time) * 1000, 2)
+            result = sock.connect_ex((ip_address, port))
+            connection_time = (time.perf_counter_ns() - start_time) // 1_000_000
             sock.close()
             
             return {
@@ -137,15 +442,19 @@ class SiteConnectivityChecker:
         Returns:
             Dict: SSL certificate information
         """
+        connection_time = None
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((hostname, port), timeout=self.timeout) as sock:
+            context = _SSL_CONTEXT
+            ip_address, _ = _resolve(hostname, self.timeout, self.dns_servers)
+            start_time = time.perf_counter_ns()
+            with socket.create_connection((ip_address, port), timeout=self.timeout) as sock:
+                connection_time = (time.perf_counter_ns() - start_time) // 1_000_000
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert = ssock.getpeercert()
                     
                     # Parse certificate dates
-                    not_before = datetime.strptime(cert['notBefore'], '%b %d %H:%M:%S %Y %Z')
-                    not_after = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
+                    not_before = _parse_cert_time(cert['notBefore'])
+                    not_after = _parse_cert_time(cert['notAfter'])
                     days_until_expiry = (not_after - datetime.now()).days
                     
                     return {
@@ -157,144 +466,437 @@ class SiteConnectivityChecker:
                         'not_after': cert['notAfter'],
                         'days_until_expiry': days_until_expiry,
                         'is_expired': days_until_expiry < 0,
+                        'connection_time_ms': connection_time,
                         'error': None
                     }
         except Exception as e:
             return {
                 'success': False,
+                'connection_time_ms': connection_time,
                 'error': str(e)
             }
     
-    def check_http_response(self, url: str) -> Dict[str, any]:
+    def _get_connection(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take an idle keep-alive connection to a host, or create a new one.
+        
+        Args:
+            scheme (str): 'http' or 'https'
+            netloc (str): Host and optional port
+            
+        Returns:
+            Tuple[HTTPConnection, bool]: Connection and whether it was reused
+        """
+        with self._pool_lock:
+            idle = self._idle_connections.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        
+        connection_class = _HTTP_CONNECTIONS.get(scheme)
+        if connection_class is None:
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        
+        if scheme == 'https':
+            return connection_class(netloc, timeout=self.timeout, context=_SSL_CONTEXT), False
+        return connection_class(netloc, timeout=self.timeout), False
+    
+    def _release_connection(self, scheme: str, netloc: str,
+                            connection: http.client.HTTPConnection,
+                            response: http.client.HTTPResponse) -> None:
+        """
+        Return a connection to the pool if it can carry another request.
+        
+        Responses with a body are not drained, so their connection is closed.
+        
+        Args:
+            scheme (str): 'http' or 'https'
+            netloc (str): Host and optional port
+            connection (HTTPConnection): Connection the response came from
+            response (HTTPResponse): Response whose headers have been read
+        """
+        if not response.will_close and response.length == 0:
+            response.read()
+            with self._pool_lock:
+                idle = self._idle_connections.setdefault((scheme, netloc), [])
+                if len(idle) < _MAX_IDLE_CONNECTIONS:
+                    idle.append(connection)
+                    return
+        connection.close()
+    
+    def _send(self, scheme: str, netloc: str, method: str, path: str,
+              timing: Dict[str, int]) -> http.client.HTTPResponse:
+        """
+        Send one request over a pooled connection.
+        
+        A reused connection the server has already closed is retried once on
+        a new connection.
+        
+        Args:
+            scheme (str): 'http' or 'https'
+            netloc (str): Host and optional port
+            method (str): HTTP method
+            path (str): Request path and query
+            timing (Dict): Gets 'connection_time_ms' (0 when an open connection
+                was reused) as soon as the first connection is made, so it
+                survives a failure later in the request
+            
+        Returns:
+            HTTPResponse: Response with its status and headers read
+            
+        Raises:
+            socket.timeout: A follow-up request (redirect, GET fallback or
+                retry) would start after the running check's deadline
+        """
+        while True:
+            deadline = getattr(_check_deadline, 'at', None)
+            if timing and deadline is not None and time.monotonic() > deadline:
+                raise socket.timeout("check ran out of time")
+            
+            connection, reused = self._get_connection(scheme, netloc)
+            try:
+                connection_time = 0
+                if not reused:
+                    start_time = time.perf_counter_ns()
+                    connection.connect()
+                    connection_time = (time.perf_counter_ns() - start_time) // 1_000_000
+                timing.setdefault('connection_time_ms', connection_time)
+                connection.request(method, path, headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+                })
+                response = connection.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            
+            # Status and headers are parsed; any body is left unread
+            self._release_connection(scheme, netloc, connection, response)
+            return response
+    
+    @staticmethod
+    def _head_size(response: http.client.HTTPResponse) -> int:
+        """Approximate size in bytes of a response's status line and headers."""
+        size = len(f"HTTP/1.1 {response.status} {response.reason}\r\n\r\n")
+        for name, value in response.headers.items():
+            size += len(name) + len(value) + 4
+        return size
+    
+    @staticmethod
+    def _head_unsupported(response: http.client.HTTPResponse) -> bool:
+        """Whether a response to HEAD says the server does not support HEAD."""
+        if response.status in (405, 501):
+            return True
+        allow = response.getheader('Allow')
+        return allow is not None and 'HEAD' not in (m.strip().upper() for m in allow.split(','))
+    
+    def _open_url(self, url: str, method: str,
+                  timing: Dict[str, int]) -> Tuple[http.client.HTTPResponse, str, int]:
+        """
+        Send a single request, following redirects, without reading the body.
+        
+        Args:
+            url (str): URL to request
+            method (str): HTTP method
+            timing (Dict): Gets the connection time to the first host, see _send
+            
+        Returns:
+            Tuple[HTTPResponse, str, int]: Final response, the URL it came from
+            and the bytes of response heads read across all hops
+        """
+        bytes_read = 0
+        for _ in range(_MAX_REDIRECTS + 1):
+            parsed = urllib.parse.urlsplit(url)
+            path = parsed.path or '/'
+            if parsed.query:
+                path += '?' + parsed.query
+            
+            response = self._send(parsed.scheme, parsed.netloc, method, path, timing)
+            bytes_read += self._head_size(response)
+            
+            location = response.getheader('Location')
+            if response.status not in _REDIRECT_CODES or not location:
+                return response, url, bytes_read
+            url = urllib.parse.urljoin(url, location)
+        
+        raise http.client.HTTPException(f"Too many redirects (more than {_MAX_REDIRECTS})")
+    
+    def check_http_response(self, url: str, method: Optional[str] = None,
+                            verbose: Optional[bool] = None) -> Dict[str, any]:
         """
         Check HTTP response from URL.
         
         Args:
             url (str): URL to check
+            method (str): HTTP method; defaults to the checker's http_method.
+                HEAD avoids downloading the response body.
+            verbose (bool): Add a 'headers' dict with every response header;
+                defaults to the checker's verbose setting
             
         Returns:
-            Dict: HTTP response information
+            Dict: HTTP response information; 'bytes_transferred' counts the
+            response status lines and headers read, as bodies are never
+            downloaded
         """
+        method = method or self.http_method
+        if verbose is None:
+            verbose = self.verbose
+        
+        timing = {}
         try:
-            # Create request with custom headers
-            request = urllib.request.Request(url)
-            request.add_header('User-Agent', self.user_agent)
-            request.add_header('Accept', 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8')
+            start_time = time.perf_counter_ns()
+            response, final_url, bytes_transferred = self._open_url(url, method, timing)
             
-            start_time = time.time()
+            if method == 'HEAD' and self._head_unsupported(response):
+                # Retry with GET; its body is still left unread
+                start_time = time.perf_counter_ns()
+                response, final_url, get_bytes = self._open_url(url, 'GET', timing)
+                bytes_transferred += get_bytes
             
-            # Make the request
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                response_time = round((time.time() - start_time) * 1000, 2)
-                content_length = response.headers.get('Content-Length', 'Unknown')
-                
+            response_time = (time.perf_counter_ns() - start_time) // 1_000_000
+            
+            if response.status >= 400:
                 return {
-                    'success': True,
-                    'status_code': response.getcode(),
+                    'success': False,
+                    'status_code': response.status,
                     'response_time_ms': response_time,
-                    'content_length': content_length,
-                    'content_type': response.headers.get('Content-Type', 'Unknown'),
-                    'server': response.headers.get('Server', 'Unknown'),
-                    'final_url': response.geturl(),
-                    'headers': dict(response.headers),
-                    'error': None
+                    'connection_time_ms': timing['connection_time_ms'],
+                    'bytes_transferred': bytes_transferred,
+                    'error': f"HTTP Error {response.status}: {response.reason}"
                 }
-                
-        except urllib.error.HTTPError as e:
-            response_time = round((time.time() - start_time) * 1000, 2)
-            return {
-                'success': False,
-                'status_code': e.code,
+            
+            headers = response.headers
+            result = {
+                'success': True,
+                'status_code': response.status,
                 'response_time_ms': response_time,
-                'error': f"HTTP Error {e.code}: {e.reason}"
+                'content_length': headers.get('Content-Length', 'Unknown'),
+                'content_type': headers.get('Content-Type', 'Unknown'),
+                'server': headers.get('Server', 'Unknown'),
+                'final_url': final_url,
+                'connection_time_ms': timing['connection_time_ms'],
+                'bytes_transferred': bytes_transferred,
+                'error': None
             }
-        except urllib.error.URLError as e:
+            if verbose:
+                result['headers'] = dict(headers)
+            return result
+            
+        except OSError as e:
+            # Connection, TLS and timeout failures; a connection made before
+            # the failure still shows the port was reachable
             return {
                 'success': False,
                 'status_code': None,
                 'response_time_ms': None,
-                'error': f"URL Error: {e.reason}"
+                'connection_time_ms': timing.get('connection_time_ms'),
+                'error': f"{_URL_ERROR_LABEL}{e}"
             }
         except Exception as e:
             return {
                 'success': False,
                 'status_code': None,
                 'response_time_ms': None,
+                'connection_time_ms': timing.get('connection_time_ms'),
                 'error': str(e)
             }
     
-    def comprehensive_check(self, url: str) -> Dict[str, any]:
+    @staticmethod
+    def _port_check_from(port: int, *probes: Dict[str, any]) -> Dict[str, any]:
         """
-        Perform comprehensive connectivity check for a URL.
+        Derive the port connectivity result from the SSL and HTTP probes.
+        
+        Any probe that got a TCP connection proves the port is reachable, even
+        if it failed afterwards, so no separate connection is opened just to
+        test it.
+        
+        Args:
+            port (int): Port the probes connected to
+            *probes (Dict): SSL and/or HTTP check results, most telling first
+            
+        Returns:
+            Dict: Port connectivity results, as from check_port_connectivity;
+            marked cached when the probe it came from was
+        """
+        for probe in probes:
+            connection_time = probe.get('connection_time_ms')
+            if connection_time is not None:
+                port_result = {
+                    'success': True,
+                    'port': port,
+                    'connection_time_ms': connection_time,
+                    'error': None
+                }
+                if probe.get('cached'):
+                    port_result['cached'] = True
+                return port_result
+        
+        # Report the connection failure itself, without the HTTP check's label
+        error = probes[0]['error']
+        if error.startswith(_URL_ERROR_LABEL):
+            error = error[len(_URL_ERROR_LABEL):]
+        return {
+            'success': False,
+            'port': port,
+            'connection_time_ms': None,
+            'error': error
+        }
+    
+    def _collect_checks(self, checks: Dict[str, _TimedCheck]) -> Dict[str, Dict[str, any]]:
+        """
+        Wait for a site's checks, each for up to site_budget once it runs.
+        
+        Args:
+            checks (Dict): Check name mapped to the submitted check
+            
+        Returns:
+            Dict: Check name mapped to its result; checks that do not start
+            or finish in time get a failed result
+        """
+        results = {}
+        for name, check in checks.items():
+            results[name] = check.result(self._queue_limit)
+        return results
+    
+    def _start_site(self, url: str, shared: Optional[Dict[Tuple, any]] = None) -> Dict[str, any]:
+        """
+        Validate a URL and start its checks without waiting for them.
         
         Args:
             url (str): URL to check
+            shared (Dict): Host-level checks (DNS, and SSL per
+                host and port) already started for other URLs in the batch;
+                matching checks reuse them instead of probing again
             
         Returns:
-            Dict: Complete check results
+            Dict: Pending site state for _finish_site
         """
+        site = {'url': url, 'timestamp': datetime.now().isoformat(), 'error': None}
         try:
             # Validate and normalize URL
             normalized_url = self.validate_url(url)
             parsed_url = urllib.parse.urlparse(normalized_url)
-            hostname = parsed_url.netloc
+            hostname = parsed_url.hostname
             is_https = parsed_url.scheme == 'https'
+            port = parsed_url.port or (443 if is_https else 80)
+            
+            # The checks are independent, so they run at the same time and a
+            # stalled host costs at most site_budget once its checks start
+            http_key = f"http {self.http_method}{' verbose' if self.verbose else ''} {normalized_url}"
+            checks = {
+                ('dns', hostname): (self._cached, f"dns {hostname}", self.check_dns_resolution, hostname),
+                ('http', normalized_url): (self._cached, http_key, self.check_http_response, normalized_url)
+            }
+            if is_https:
+                checks[('ssl', hostname, port)] = (self._cached, f"ssl {hostname}:{port}",
+                                                   self.check_ssl_certificate, hostname, port)
             
-            print(f"Checking: {normalized_url}")
+            started = {}
+            for key, call in checks.items():
+                check = shared.get(key) if shared is not None else None
+                if check is None:
+                    check = _TimedCheck(self._executor, self.site_budget, call)
+                    if shared is not None and key[0] != 'http':
+                        shared[key] = check
+                started[key[0]] = check
+            
+            site.update(
+                normalized_url=normalized_url,
+                hostname=hostname,
+                port=port,
+                is_https=is_https,
+                checks=started
+            )
+        except Exception as e:
+            site['error'] = str(e)
+        return site
+    
+    def _finish_site(self, site: Dict[str, any], emit) -> Dict[str, any]:
+        """
+        Wait for a started site's checks and build its result.
+        
+        Args:
+            site (Dict): Pending site state from _start_site
+            emit: Called with each progress line
+            
+        Returns:
+            Dict: Complete check results
+        """
+        try:
+            if site['error'] is not None:
+                raise ValueError(site['error'])
+            
+            normalized_url = site['normalized_url']
+            is_https = site['is_https']
+            
+            emit(f"Checking: {normalized_url}")
             
             # Initialize result structure
             result = {
                 'url': normalized_url,
-                'hostname': hostname,
-                'timestamp': datetime.now().isoformat(),
+                'hostname': site['hostname'],
+                'timestamp': site['timestamp'],
                 'checks': {}
             }
             
+            check_results = self._collect_checks(site['checks'])
+            
             # 1. DNS Resolution Check
-            print("  → Checking DNS resolution...")
-            result['checks']['dns'] = self.check_dns_resolution(hostname)
+            emit("  → Checking DNS resolution...")
+            result['checks']['dns'] = check_results['dns']
             
             if result['checks']['dns']['success']:
                 ip = result['checks']['dns']['ip_address']
-                print(f"    ✓ Resolved to: {ip}")
+                emit(f"    ✓ Resolved to: {ip}{_cached_note(result['checks']['dns'])}")
                 
                 # 2. Port Connectivity Check
-                port = 443 if is_https else 80
-                print(f"  → Checking port {port} connectivity...")
-                result['checks']['port'] = self.check_port_connectivity(hostname, port)
+                port = site['port']
+                emit(f"  → Checking port {port} connectivity...")
+                
+                # The connections the SSL and HTTP checks made also answer the
+                # port check, so no extra handshake is spent on it
+                ssl_result = check_results.get('ssl')
+                http_result = check_results['http']
+                probes = (ssl_result, http_result) if is_https else (http_result,)
+                
+                result['checks']['port'] = self._port_check_from(port, *probes)
                 
                 if result['checks']['port']['success']:
-                    print(f"    ✓ Port {port} is accessible")
+                    emit(f"    ✓ Port {port} is accessible{_cached_note(result['checks']['port'])}")
                     
                     # 3. SSL Certificate Check (for HTTPS)
                     if is_https:
-                        print("  → Checking SSL certificate...")
-                        result['checks']['ssl'] = self.check_ssl_certificate(hostname)
+                        emit("  → Checking SSL certificate...")
+                        result['checks']['ssl'] = ssl_result
                         
                         if result['checks']['ssl']['success']:
                             days_left = result['checks']['ssl']['days_until_expiry']
                             if days_left > 0:
-                                print(f"    ✓ SSL certificate valid ({days_left} days remaining)")
+                                emit(f"    ✓ SSL certificate valid ({days_left} days remaining){_cached_note(ssl_result)}")
                             else:
-                                print(f"    ⚠ SSL certificate expired ({abs(days_left)} days ago)")
+                                emit(f"    ⚠ SSL certificate expired ({abs(days_left)} days ago){_cached_note(ssl_result)}")
                         else:
-                            print(f"    ✗ SSL check failed: {result['checks']['ssl']['error']}")
+                            emit(f"    ✗ SSL check failed: {result['checks']['ssl']['error']}")
                     
                     # 4. HTTP Response Check
-                    print("  → Checking HTTP response...")
-                    result['checks']['http'] = self.check_http_response(normalized_url)
+                    emit("  → Checking HTTP response...")
+                    result['checks']['http'] = http_result
                     
                     if result['checks']['http']['success']:
                         status = result['checks']['http']['status_code']
                         time_ms = result['checks']['http']['response_time_ms']
-                        print(f"    ✓ HTTP {status} ({time_ms}ms)")
+                        emit(f"    ✓ HTTP {status} ({time_ms}ms){_cached_note(http_result)}")
                     else:
-                        print(f"    ✗ HTTP check failed: {result['checks']['http']['error']}")
+                        emit(f"    ✗ HTTP check failed: {result['checks']['http']['error']}")
                         
                 else:
-                    print(f"    ✗ Port {port} is not accessible: {result['checks']['port']['error']}")
+                    emit(f"    ✗ Port {port} is not accessible: {result['checks']['port']['error']}")
             else:
-                print(f"    ✗ DNS resolution failed: {result['checks']['dns']['error']}")
+                emit(f"    ✗ DNS resolution failed: {result['checks']['dns']['error']}")
             
             # Determine overall status
             result['overall_success'] = (
@@ -307,13 +909,28 @@ class SiteConnectivityChecker:
             
         except Exception as e:
             return {
-                'url': url,
-                'timestamp': datetime.now().isoformat(),
+                'url': site['url'],
+                'timestamp': site['timestamp'],
                 'overall_success': False,
                 'error': str(e),
                 'checks': {}
             }
     
+    def comprehensive_check(self, url: str, output: Optional[List[str]] = None) -> Dict[str, any]:
+        """
+        Perform comprehensive connectivity check for a URL.
+        
+        Args:
+            url (str): URL to check
+            output (List[str]): Collect progress lines here instead of
+                printing them
+            
+        Returns:
+            Dict: Complete check results
+        """
+        emit = print if output is None else output.append
+        return self._finish_site(self._start_site(url), emit)
+    
     def check_multiple_sites(self, urls: List[str]) -> List[Dict[str, any]]:
         """
         Check connectivity for multiple sites.
@@ -328,70 +945,93 @@ class SiteConnectivityChecker:
         
         print(f"Checking connectivity for {len(urls)} site(s)...\n")
         
-        for i, url in enumerate(urls, 1):
-            print(f"[{i}/{len(urls)}] ", end="")
-            result = self.comprehensive_check(url)
+        # Up to max_workers sites have their checks in flight on the shared
+        # pool, so the batch takes about as long as its slowest sites while
+        # this thread only waits on them in input order and prints each
+        # site's progress as one block
+        remaining = iter(urls)
+        shared = {}
+        pending = deque(self._start_site(url, shared) for url in islice(remaining, self.max_workers))
+        
+        i = 0
+        while pending:
+            site = pending.popleft()
+            output = []
+            result = self._finish_site(site, output.append)
             results.append(result)
+            pending.extend(self._start_site(url, shared) for url in islice(remaining, 1))
             
-            # Print summary
+            # Print progress and summary
+            i += 1
             status = "✓ ONLINE" if result['overall_success'] else "✗ OFFLINE"
-            print(f"  → {status}\n")
+            output.append(f"  → {status}\n")
+            sys.stdout.write(f"[{i}/{len(urls)}] " + "\n".join(output) + "\n")
         
         self.results = results
         return results
     
-    def generate_report(self, format_type: str = 'text') -> str:
+    def generate_report(self, format_type: str = 'text', out=None) -> Optional[str]:
         """
         Generate a formatted report of check results.
         
         Args:
             format_type (str): Report format ('text' or 'json')
+            out: Writable text file to stream the report into; when omitted
+                the report is built in memory and returned
             
         Returns:
-            str: Formatted report
+            Optional[str]: Formatted report, or None when written to out
         """
+        if out is None:
+            buffer = io.StringIO()
+            self.generate_report(format_type, buffer)
+            return buffer.getvalue()
+        
+        write = out.write
+        
         if not self.results:
-            return "No results available. Run checks first."
+            write("No results available. Run checks first.")
+            return None
         
         if format_type.lower() == 'json':
-            return json.dumps(self.results, indent=2, default=str)
+            json.dump(self.results, out, indent=2, default=str)
+            return None
         
         # Text format report
-        report = []
-        report.append("=" * 60)
-        report.append("SITE CONNECTIVITY REPORT")
-        report.append("=" * 60)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Sites checked: {len(self.results)}")
-        report.append("")
+        write("=" * 60 + "\n")
+        write("SITE CONNECTIVITY REPORT\n")
+        write("=" * 60 + "\n")
+        write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Sites checked: {len(self.results)}\n")
         
         for i, result in enumerate(self.results, 1):
-            report.append(f"{i}. {result['url']}")
-            report.append("-" * len(f"{i}. {result['url']}"))
+            title = f"{i}. {result['url']}"
+            write(f"\n{title}\n")
+            write("-" * len(title) + "\n")
             
             if result['overall_success']:
-                report.append("Status: ✓ ONLINE")
+                write("Status: ✓ ONLINE\n")
             else:
-                report.append("Status: ✗ OFFLINE")
+                write("Status: ✗ OFFLINE\n")
             
             # DNS Info
             if 'dns' in result['checks']:
                 dns = result['checks']['dns']
                 if dns['success']:
-                    report.append(f"IP Address: {dns['ip_address']}")
-                    report.append(f"DNS Resolution: {dns['resolution_time_ms']}ms")
+                    write(f"IP Address: {dns['ip_address']}{_cached_note(dns)}\n")
+                    write(f"DNS Resolution: {dns['resolution_time_ms']}ms\n")
                 else:
-                    report.append(f"DNS Error: {dns['error']}")
+                    write(f"DNS Error: {dns['error']}\n")
             
             # HTTP Info
             if 'http' in result['checks']:
                 http = result['checks']['http']
                 if http['success']:
-                    report.append(f"HTTP Status: {http['status_code']}")
-                    report.append(f"Response Time: {http['response_time_ms']}ms")
-                    report.append(f"Server: {http.get('server', 'Unknown')}")
+                    write(f"HTTP Status: {http['status_code']}{_cached_note(http)}\n")
+                    write(f"Response Time: {http['response_time_ms']}ms\n")
+                    write(f"Server: {http.get('server', 'Unknown')}\n")
                 else:
-                    report.append(f"HTTP Error: {http['error']}")
+                    write(f"HTTP Error: {http['error']}\n")
             
             # SSL Info
             if 'ssl' in result['checks']:
@@ -399,13 +1039,11 @@ class SiteConnectivityChecker:
                 if ssl_info['success']:
                     days = ssl_info['days_until_expiry']
                     status = "Valid" if days > 0 else "EXPIRED"
-                    report.append(f"SSL Certificate: {status} ({days} days)")
+                    write(f"SSL Certificate: {status} ({days} days){_cached_note(ssl_info)}\n")
                 else:
-                    report.append(f"SSL Error: {ssl_info['error']}")
-            
-            report.append("")
+                    write(f"SSL Error: {ssl_info['error']}\n")
         
-        return "\n".join(report)
+        return None
 
 
 def main():
@@ -457,6 +1095,46 @@ Examples:
         help='Custom User-Agent string'
     )
     
+    parser.add_argument(
+        '--get',
+        action='store_true',
+        help='Use GET instead of HEAD for the HTTP check'
+    )
+    
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=32,
+        help='Number of sites to check at the same time (default: 32)'
+    )
+    
+    parser.add_argument(
+        '--dns-server',
+        action='append',
+        metavar='IP',
+        help='Also query this DNS server and use the fastest answer '
+             '(repeatable, requires dnspython)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Probe every site instead of reusing recent results from {DEFAULT_CACHE_FILE}'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=60,
+        help='Seconds a successful check result is reused (default: 60)'
+    )
+    
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Include all HTTP response headers in the results'
+    )
+    
     args = parser.parse_args()
     
     # Collect URLs to check
@@ -479,26 +1157,33 @@ Examples:
         print("Error: No URLs provided. Use --help for usage information.")
         sys.exit(1)
     
+    if args.dns_server and not DNSPYTHON_AVAILABLE:
+        print("Warning: dnspython is not installed; using the system resolver only.")
+    
     # Initialize checker
     checker = SiteConnectivityChecker(
         timeout=args.timeout,
-        user_agent=args.user_agent
+        user_agent=args.user_agent,
+        http_method='GET' if args.get else 'HEAD',
+        verbose=args.verbose,
+        max_workers=args.workers,
+        dns_servers=args.dns_server,
+        cache_file=None if args.no_cache else DEFAULT_CACHE_FILE,
+        cache_ttl=args.cache_ttl
     )
     
     try:
         # Run checks
         results = checker.check_multiple_sites(urls_to_check)
         
-        # Generate report
-        report = checker.generate_report(args.format)
-        
-        # Output results
+        # Stream the report to its destination
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(report)
+                checker.generate_report(args.format, f)
             print(f"Results saved to: {args.output}")
         else:
-            print(report)
+            checker.generate_report(args.format, sys.stdout)
+            sys.stdout.write("\n")
         
         # Exit with appropriate code
         failed_checks = sum(1 for r in results if not r['overall_success'])
@@ -515,6 +1200,8 @@ Examples:
     except Exception as e:
         print(f"Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        checker.close()
 
 
 # Simple unit tests (run with: python main.py --test)